@@ -2,28 +2,31 @@
 Audio playback engine using miniaudio for cross-platform support
 """
 
-from typing import Optional, List
-from pathlib import Path
+import logging
+from typing import Optional, Deque, Generator, Iterator
+from collections import deque
 import threading
 import time
 from PySide6.QtCore import QObject, Signal, QTimer
+import numpy as np
 import miniaudio
+from mutagen import File as MutagenFile
 from core.audio_scanner import AudioTrack
 
+logger = logging.getLogger(__name__)
+
 
 class PlaybackHistory:
     """Manages playback history for back-skipping."""
     
     def __init__(self, max_size: int = 15) -> None:
         self.max_size = max_size
-        self._history: List[AudioTrack] = []
+        # Bounded deque discards the oldest track once max_size is reached
+        self._history: Deque[AudioTrack] = deque(maxlen=max_size)
         
     def add(self, track: AudioTrack) -> None:
         """Add a track to history."""
         self._history.append(track)
-        # Keep only last max_size tracks
-        if len(self._history) > self.max_size:
-            self._history.pop(0)
             
     def get_previous(self) -> Optional[AudioTrack]:
         """Get the previous track from history."""
@@ -43,9 +46,71 @@ class PlaybackHistory:
         return len(self._history)
 
 
+class PCMRingBuffer:
+    """
+    Single-producer/single-consumer ring buffer of interleaved int16 frames.
+    
+    The decoder thread is the only writer and the audio device callback the
+    only reader. Each side owns one monotonically increasing frame counter
+    and publishes it only after copying, so no lock is taken on the audio thread.
+    """
+    
+    def __init__(self, frames: int, nchannels: int) -> None:
+        if frames & (frames - 1):
+            raise ValueError("Ring buffer size must be a power of two")
+        self.frames = frames
+        self.nchannels = nchannels
+        self._mask = frames - 1
+        self._buffer = np.zeros(frames * nchannels, dtype=np.int16)
+        self._write_idx = 0  # Total frames written (producer only)
+        self._read_idx = 0  # Total frames read (consumer only)
+        
+    def available(self) -> int:
+        """Number of frames ready to be read."""
+        return self._write_idx - self._read_idx
+        
+    def free(self) -> int:
+        """Number of frames that can be written without overwriting unread data."""
+        return self.frames - (self._write_idx - self._read_idx)
+        
+    def write(self, samples: np.ndarray) -> int:
+        """Copy as many whole frames as fit; returns the number of frames written."""
+        nch = self.nchannels
+        count = min(len(samples) // nch, self.free())
+        if count <= 0:
+            return 0
+        start = self._write_idx & self._mask
+        first = min(count, self.frames - start)
+        self._buffer[start * nch:(start + first) * nch] = samples[:first * nch]
+        if count > first:
+            self._buffer[:(count - first) * nch] = samples[first * nch:count * nch]
+        self._write_idx += count
+        return count
+        
+    def read(self, frames: int) -> bytes:
+        """Read up to the requested frames; returns fewer on underrun."""
+        nch = self.nchannels
+        count = min(frames, self.available())
+        if count <= 0:
+            return b""
+        start = self._read_idx & self._mask
+        first = min(count, self.frames - start)
+        data = self._buffer[start * nch:(start + first) * nch].tobytes()
+        if count > first:
+            data += self._buffer[:(count - first) * nch].tobytes()
+        self._read_idx += count
+        return data
+
+
 class AudioEngine(QObject):
     """Cross-platform audio playback engine."""
     
+    # PCM output format used for decoding (matches PlaybackDevice defaults)
+    SAMPLE_RATE = 44100
+    NCHANNELS = 2
+    RING_FRAMES = 1 << 15  # ~0.75s of decoded audio between decoder and device
+    DEFAULT_BUFFER_MSEC = 20  # Device period; low latency for start, pause and seek
+    
     # Signals
     playback_started = Signal(AudioTrack)
     playback_paused = Signal()
@@ -56,14 +121,13 @@ class AudioEngine(QObject):
     duration_changed = Signal(float)  # Total duration in seconds
     error_occurred = Signal(str)
     
-    def __init__(self) -> None:
+    def __init__(self, buffer_msec: int = DEFAULT_BUFFER_MSEC) -> None:
         super().__init__()
+        self.buffer_msec = buffer_msec
         self.current_track: Optional[AudioTrack] = None
         self.history = PlaybackHistory()
         
         self._device: Optional[miniaudio.PlaybackDevice] = None
-        self._decoder: Optional[miniaudio.Decoder] = None
-        self._stream: Optional[miniaudio.stream_file] = None
         self._is_playing = False
         self._is_paused = False
         self._position = 0.0
@@ -72,11 +136,13 @@ class AudioEngine(QObject):
         self._stop_playback = False
         self._seek_position: Optional[float] = None  # Target seek position
         self._pause_position = 0.0  # Position when paused
+        self._stop_event = threading.Event()  # Wakes the playback worker on stop/pause
+        self._start_ns: Optional[int] = None  # Monotonic timestamp (ns) the device started
         
         # Timer for position updates
         self._position_timer = QTimer()
         self._position_timer.timeout.connect(self._update_position)
-        self._position_timer.setInterval(100)  # Update every 100ms
+        self._position_timer.setInterval(250)  # 4 Hz is smooth enough for the progress UI
         
     def play(self, track: AudioTrack, start_position: float = 0.0) -> bool:
         """
@@ -96,17 +162,14 @@ class AudioEngine(QObject):
             self.current_track = track
             file_path = str(track.file_path)
             
-            # Decode the audio file to get duration
-            try:
-                decoder = miniaudio.decode_file(file_path)
-                self._duration = len(decoder.samples) / decoder.sample_rate / decoder.nchannels
-                self.duration_changed.emit(self._duration)
-            except Exception as e:
-                print(f"Could not decode file for duration: {e}")
-                self._duration = 0.0
+            # Duration comes from scanned metadata; only probe headers as a fallback
+            self._duration = track.duration or self._probe_duration(file_path)
+            self.duration_changed.emit(self._duration)
             
             # Start playback in separate thread
             self._stop_playback = False
+            self._stop_event.clear()
+            self._start_ns = None
             self._is_playing = True
             self._is_paused = False
             self._position = start_position
@@ -127,45 +190,53 @@ class AudioEngine(QObject):
             
         except Exception as e:
             error_msg = f"Failed to play track: {e}"
-            print(error_msg)
+            logger.error(error_msg)
             self.error_occurred.emit(error_msg)
             return False
             
+    def _probe_duration(self, file_path: str) -> float:
+        """Read track duration from file headers without decoding audio."""
+        try:
+            audio = MutagenFile(file_path)
+            if audio is not None:
+                return getattr(audio.info, 'length', 0.0)
+        except Exception as e:
+            logger.warning("Could not read duration: %s", e)
+        return 0.0
+            
     def _playback_worker(self, file_path: str) -> None:
         """Worker thread for audio playback."""
         try:
-            # Use file streaming for all cases - simple and works
-            stream = miniaudio.stream_file(file_path)
-            
-            # If seeking, we need to skip samples
-            if self._seek_position and self._seek_position > 0:
-                # Decode to get format info first
-                decoded = miniaudio.decode_file(file_path)
-                sample_rate = decoded.sample_rate
-                nchannels = decoded.nchannels
+            # Let the decoder seek within the bitstream instead of decoding up to the target
+            seek_frame = int((self._seek_position or 0.0) * self.SAMPLE_RATE)
+            stream = miniaudio.stream_file(
+                file_path,
+                sample_rate=self.SAMPLE_RATE,
+                nchannels=self.NCHANNELS,
+                seek_frame=seek_frame
+            )
                 
-                # Calculate how many samples to skip
-                seek_frame = int(self._seek_position * sample_rate)
-                samples_to_skip = seek_frame * nchannels
-                
-                # Consume the stream to skip to position
-                consumed = 0
-                for chunk in stream:
-                    chunk_len = len(chunk)
-                    if consumed + chunk_len > samples_to_skip:
-                        # This chunk contains our start position
-                        break
-                    consumed += chunk_len
+            try:
+                ring = PCMRingBuffer(self.RING_FRAMES, self.NCHANNELS)
+                pending = self._fill_ring(ring, stream, None)
+                callback = self._ring_reader(ring)
+                next(callback)
                 
-            with miniaudio.PlaybackDevice() as device:
-                self._device = device
-                device.start(stream)
-                self._wait_for_playback()
+                with miniaudio.PlaybackDevice(
+                    sample_rate=self.SAMPLE_RATE,
+                    nchannels=self.NCHANNELS,
+                    buffersize_msec=self.buffer_msec
+                ) as device:
+                    self._device = device
+                    device.start(callback)
+                    self._wait_for_playback(ring, stream, pending)
+            finally:
+                # The device's callback thread reads from the ring, so only
+                # close the decoder once the device context has stopped
+                stream.close()
                         
         except Exception as e:
-            print(f"Playback error: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Playback error: %s", e)
             self.error_occurred.emit(str(e))
         finally:
             self._device = None
@@ -178,39 +249,71 @@ class AudioEngine(QObject):
                 # Track was stopped
                 self.playback_stopped.emit()
     
-    def _wait_for_playback(self) -> None:
-        """Wait for playback to finish with pause support."""
-        start_time = time.time()
-        pause_accumulated = 0.0
-        last_pause_time = None
+    def _ring_reader(self, ring: PCMRingBuffer) -> Generator[bytes, int, None]:
+        """Device callback generator that drains decoded frames from the ring."""
+        required_frames = yield b""
+        while True:
+            required_frames = yield ring.read(required_frames)
+            
+    def _fill_ring(self, ring: PCMRingBuffer, stream: Iterator,
+                   pending: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """
+        Decode into the ring until it is full or the stream ends.
         
-        while self._is_playing and not self._stop_playback:
-            if self._is_paused:
-                if last_pause_time is None:
-                    last_pause_time = time.time()
-                time.sleep(0.05)
-            else:
-                if last_pause_time is not None:
-                    pause_accumulated += time.time() - last_pause_time
-                    last_pause_time = None
-                
-                # Update position estimate
-                elapsed = time.time() - start_time - pause_accumulated
-                self._position = (self._seek_position or 0.0) + elapsed
-                
-                time.sleep(0.05)  # Check every 50ms
+        Returns the samples that did not fit yet, an empty array at end of
+        stream, or None if the next chunk still has to be decoded.
+        """
+        while ring.free() > 0:
+            if pending is None:
+                try:
+                    pending = np.frombuffer(next(stream), dtype=np.int16)
+                except StopIteration:
+                    return np.empty(0, dtype=np.int16)
+            if len(pending) == 0:
+                return pending
+            written = ring.write(pending)
+            pending = pending[written * ring.nchannels:]
+            if len(pending) == 0:
+                pending = None
+        return pending
+        
+    def _wait_for_playback(self, ring: PCMRingBuffer, stream: Iterator,
+                           pending: Optional[np.ndarray]) -> None:
+        """Keep the ring topped up until the track ends or playback is stopped."""
+        self._start_ns = time.monotonic_ns()
+        refill_interval = ring.frames / self.SAMPLE_RATE / 4
+        
+        # Decode ahead while the device drains the ring
+        while pending is None or len(pending) > 0:
+            if self._stop_event.wait(timeout=refill_interval):
+                self._position = self._current_position()
+                return
+            pending = self._fill_ring(ring, stream, pending)
+            
+        # Everything is decoded; wait out whatever is still buffered
+        if self._duration > 0:
+            remaining = self._duration - self._current_position()
+        else:
+            remaining = ring.available() / self.SAMPLE_RATE
+        self._stop_event.wait(timeout=max(0.0, remaining))
             
-            # Check if playback finished
-            if self._position >= self._duration and self._duration > 0:
-                break
+        self._position = self._current_position()
+        
+    def _current_position(self) -> float:
+        """Derive the playback position from the time the device started."""
+        if self._start_ns is None:
+            return self._seek_position or 0.0
+        elapsed_ns = time.monotonic_ns() - self._start_ns
+        return (self._seek_position or 0.0) + elapsed_ns * 1e-9
                 
     def pause(self) -> None:
         """Pause playback by stopping and saving position."""
         if self._is_playing and not self._is_paused:
             self._is_paused = True
-            self._pause_position = self._position
+            self._pause_position = self._current_position()
             # Stop the playback thread - we'll restart from saved position on resume
             self._stop_playback = True
+            self._stop_event.set()
             self._position_timer.stop()
             
             # Wait for thread to finish
@@ -234,6 +337,7 @@ class AudioEngine(QObject):
         """Stop playback."""
         if self._is_playing:
             self._stop_playback = True
+            self._stop_event.set()
             self._is_playing = False
             self._is_paused = False
             self._position_timer.stop()
@@ -256,15 +360,14 @@ class AudioEngine(QObject):
         Seek to position in seconds by restarting playback from that position.
         """
         if self.current_track and 0 <= position <= self._duration:
-            was_paused = self._is_paused
-            was_playing = self._is_playing
-            
-            if was_playing or was_paused:
+            if self._is_paused:
+                # Nothing is playing, so just move the resume point instead of
+                # starting playback and blocking until it can be paused again
+                self._pause_position = position
+                self._position = position
+                self.position_changed.emit(position)
+            elif self._is_playing:
                 self.play(self.current_track, start_position=position)
-                if was_paused:
-                    # If we were paused, pause again after seeking
-                    time.sleep(0.1)  # Brief delay to let playback start
-                    self.pause()
             
     def get_position(self) -> float:
         """Get current playback position in seconds."""
@@ -289,4 +392,5 @@ class AudioEngine(QObject):
     def _update_position(self) -> None:
         """Timer callback to emit position updates."""
         if self._is_playing and not self._is_paused:
+            self._position = self._current_position()
             self.position_changed.emit(self._position)
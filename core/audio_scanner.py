@@ -2,19 +2,31 @@
 Audio file scanner with metadata extraction
 """
 
+import logging
+import os
+import queue
+import threading
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, FrozenSet, ClassVar, Iterator, Tuple, Set, TYPE_CHECKING
 from dataclasses import dataclass, field
-from mutagen import File as MutagenFile
+from mutagen import File as MutagenFile, MutagenError
 from mutagen.id3 import ID3NoHeaderError
 from mutagen.flac import FLAC
-from mutagen.mp3 import MP3
+from mutagen.mp3 import MP3, EasyMP3
 from mutagen.wave import WAVE
 from mutagen.oggvorbis import OggVorbis
 from mutagen.mp4 import MP4
+from mutagen.easymp4 import EasyMP4
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+if TYPE_CHECKING:
+    from core.library_cache import LibraryCache
+
+
+@dataclass(slots=True)
 class AudioTrack:
     """Audio track with metadata."""
     file_path: Path
@@ -28,18 +40,59 @@ class AudioTrack:
     format: str = "unknown"
     album_art_data: Optional[bytes] = None  # Raw album art image data
     
+    # Sort keys derived once from the metadata above, which is not mutated after construction
+    _album_sort_key: tuple = field(init=False, repr=False, compare=False)
+    _artist_sort_key: tuple = field(init=False, repr=False, compare=False)
+    _folder_sort_key: tuple = field(init=False, repr=False, compare=False)
+    _year_key: str = field(init=False, repr=False, compare=False)
+    _folder_key: str = field(init=False, repr=False, compare=False)
+    # Set when album art should be read from the file on first use instead of up front
+    _album_art_deferred: bool = field(default=False, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         if isinstance(self.file_path, str):
             self.file_path = Path(self.file_path)
+        track_number = self.track_number if self.track_number else 999
+        self._album_sort_key = (self.album, track_number)
+        self._artist_sort_key = (self.artist, self.album, track_number)
+        self._folder_sort_key = (self.file_path.parent.name, self.file_path.name)
+        self._year_key = str(self.year).split('-')[0][:4] if self.year != "Unknown" else "Unknown"
+        self._folder_key = self.file_path.parent.name
+        
+    def defer_album_art(self) -> None:
+        """Drop any album art and load it from the file when first requested."""
+        self.album_art_data = None
+        self._album_art_deferred = True
+        
+    def get_album_art(self) -> Optional[bytes]:
+        """Get raw album art data, extracting it on first access if deferred."""
+        if self._album_art_deferred:
+            self._album_art_deferred = False
+            self.album_art_data = AudioScanner._extract_album_art(self.file_path)
+        return self.album_art_data
 
 
 class AudioScanner:
     """Scans directories for audio files and extracts metadata."""
     
-    SUPPORTED_FORMATS: Set[str] = {'.mp3', '.wav', '.flac', '.ogg', '.m4a', '.aac'}
+    SUPPORTED_FORMATS: ClassVar[FrozenSet[str]] = frozenset({'.mp3', '.wav', '.flac', '.ogg', '.m4a', '.aac'})
     
-    def __init__(self) -> None:
+    # Direct readers for known extensions skip mutagen's format sniffing
+    _READERS = {
+        '.mp3': EasyMP3,
+        '.flac': FLAC,
+        '.ogg': OggVorbis,
+        '.m4a': EasyMP4,
+    }
+    
+    # Metadata extraction is I/O-bound, so threads overlap disk latency well
+    MAX_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+    # Bounds how far the directory walk may run ahead of the workers
+    SCAN_QUEUE_SIZE = 256
+    
+    def __init__(self, cache: Optional["LibraryCache"] = None) -> None:
         self.tracks: List[AudioTrack] = []
+        self.cache = cache
         
     def scan_directory(self, directory: str) -> List[AudioTrack]:
         """
@@ -57,74 +110,159 @@ class AudioScanner:
             
         self.tracks.clear()
         
-        for file_path in dir_path.rglob('*'):
-            if file_path.is_file() and file_path.suffix.lower() in self.SUPPORTED_FORMATS:
-                track = self._extract_metadata(file_path)
-                if track:
-                    self.tracks.append(track)
-                    
+        cached = self.cache.load(str(dir_path)) if self.cache else {}
+        # Paths found by this walk; cached rows for any others under the root are stale
+        seen: Set[str] = set()
+        
+        # The calling thread walks the tree while workers parse metadata, so
+        # directory traversal and tag reads overlap instead of alternating
+        work: "queue.Queue[Optional[Tuple[int, os.DirEntry]]]" = queue.Queue(
+            maxsize=self.SCAN_QUEUE_SIZE
+        )
+        results: Dict[int, AudioTrack] = {}
+        fresh: List[Tuple[int, AudioTrack]] = []
+        lock = threading.Lock()
+        workers = [
+            threading.Thread(
+                target=self._scan_worker, args=(work, results, fresh, lock), daemon=True
+            )
+            for _ in range(self.MAX_SCAN_WORKERS)
+        ]
+        for worker in workers:
+            worker.start()
+            
+        try:
+            for index, entry in enumerate(self._walk(str(dir_path))):
+                # Reuse cached metadata for files whose mtime and size are unchanged
+                try:
+                    stat = entry.stat()
+                except OSError as e:
+                    # Removed or unreadable since it was listed
+                    logger.warning("Could not stat %s: %s", entry.path, e)
+                    continue
+                seen.add(entry.path)
+                hit = cached.get(entry.path)
+                if hit and hit[0] == stat.st_mtime_ns and hit[1] == stat.st_size:
+                    with lock:
+                        results[index] = hit[2]
+                else:
+                    work.put((index, entry))
+        finally:
+            for _ in workers:
+                work.put(None)
+            for worker in workers:
+                worker.join()
+                
+        if self.cache:
+            self.cache.store(fresh, removed=cached.keys() - seen)
+            
+        # Restore walk order, since workers finish out of order
+        self.tracks.extend(results[index] for index in sorted(results))
         return self.tracks
         
-    def _extract_metadata(self, file_path: Path) -> Optional[AudioTrack]:
+    def _scan_worker(self, work: "queue.Queue[Optional[Tuple[int, os.DirEntry]]]",
+                     results: Dict[int, AudioTrack], fresh: List[Tuple[int, AudioTrack]],
+                     lock: threading.Lock) -> None:
+        """Extract metadata for queued entries until a None sentinel arrives."""
+        while True:
+            item = work.get()
+            if item is None:
+                break
+            index, entry = item
+            # One bad file must not take the worker down, or the walk blocks
+            # on a queue nobody drains
+            try:
+                track = self._extract_metadata(entry)
+                if track:
+                    with lock:
+                        results[index] = track
+                        fresh.append((entry.stat().st_mtime_ns, track))
+            except Exception as e:
+                logger.warning("Could not scan %s: %s", entry.path, e)
+        
+    def _walk(self, root: str) -> Iterator[os.DirEntry]:
+        """Recursively yield supported audio files using cached directory entries."""
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from self._walk(entry.path)
+                    elif entry.is_file():
+                        name = entry.name
+                        dot = name.rfind('.')
+                        if dot > 0 and name[dot:].lower() in self.SUPPORTED_FORMATS:
+                            yield entry
+        except OSError as e:
+            logger.warning("Could not scan %s: %s", root, e)
+        
+    def _extract_metadata(self, entry: os.DirEntry) -> Optional[AudioTrack]:
         """
         Extract metadata from audio file.
         
         Args:
-            file_path: Path to audio file
+            entry: Directory entry of the audio file
             
         Returns:
             AudioTrack object or None if extraction failed
         """
+        file_path = Path(entry.path)
         try:
-            audio = MutagenFile(str(file_path), easy=True)
+            file_size = entry.stat().st_size
+            audio = self._open_audio(file_path)
             if audio is None:
-                return self._create_fallback_track(file_path)
+                return self._create_fallback_track(file_path, file_size)
                 
-            track = AudioTrack(
-                file_path=file_path,
-                format=file_path.suffix[1:].lower(),
-                file_size=file_path.stat().st_size,
-                duration=getattr(audio.info, 'length', 0.0)
-            )
-            
-            # Extract common tags
+            # Collect tags first; AudioTrack derives its sort keys on construction
+            tags = {'title': file_path.stem}
             if hasattr(audio, 'tags') and audio.tags:
-                track.title = self._get_tag(audio, 'title', file_path.stem)
-                track.artist = self._get_tag(audio, 'artist', 'Unknown Artist')
-                track.album = self._get_tag(audio, 'album', 'Unknown Album')
-                track.year = self._get_tag(audio, 'date', 'Unknown')
+                tags['title'] = self._get_tag(audio, 'title', file_path.stem)
+                tags['artist'] = self._get_tag(audio, 'artist', 'Unknown Artist')
+                tags['album'] = self._get_tag(audio, 'album', 'Unknown Album')
+                tags['year'] = self._get_tag(audio, 'date', 'Unknown')
                 
                 # Extract track number
                 track_num = self._get_tag(audio, 'tracknumber', None)
                 if track_num:
                     try:
                         # Handle "1/12" format
-                        track.track_number = int(str(track_num).split('/')[0])
+                        tags['track_number'] = int(str(track_num).split('/')[0])
                     except (ValueError, AttributeError):
                         pass
-            else:
-                track.title = file_path.stem
             
-            # Extract album art
-            track.album_art_data = self._extract_album_art(file_path)
-                
-            return track
+            return AudioTrack(
+                file_path=file_path,
+                format=file_path.suffix[1:].lower(),
+                file_size=file_size,
+                duration=getattr(audio.info, 'length', 0.0),
+                album_art_data=self._extract_album_art(file_path),
+                **tags
+            )
             
         except Exception as e:
-            print(f"Error extracting metadata from {file_path}: {e}")
-            return self._create_fallback_track(file_path)
+            logger.warning("Error extracting metadata from %s: %s", file_path, e)
+            # The walker already stat'ed the entry, so this reads the cached result
+            return self._create_fallback_track(file_path, entry.stat().st_size)
+            
+    def _open_audio(self, file_path: Path):
+        """Open file with its format-specific reader, falling back to sniffing."""
+        reader = self._READERS.get(file_path.suffix.lower())
+        if reader is not None:
+            try:
+                return reader(str(file_path))
+            except MutagenError:
+                pass  # Content doesn't match the extension
+        return MutagenFile(str(file_path), easy=True)
             
-    def _get_tag(self, audio, tag_name: str, default: str) -> str:
+    def _get_tag(self, audio, tag_name: str, default: Optional[str]) -> Optional[str]:
         """Safely get tag value from audio file."""
         try:
-            value = audio.get(tag_name, [default])
-            if isinstance(value, list) and value:
-                return str(value[0])
-            return str(value) if value else default
-        except:
+            value = audio.get(tag_name)
+            return str(value[0]) if value else default
+        except (IndexError, TypeError, KeyError, ValueError):
             return default
             
-    def _extract_album_art(self, file_path: Path) -> Optional[bytes]:
+    @staticmethod
+    def _extract_album_art(file_path: Path) -> Optional[bytes]:
         """Extract album art from audio file."""
         try:
             # Load file without easy mode to access raw tags
@@ -160,74 +298,46 @@ class AudioScanner:
                     return picture.data
                     
         except Exception as e:
-            print(f"Could not extract album art from {file_path}: {e}")
+            logger.warning("Could not extract album art from %s: %s", file_path, e)
             
         return None
     
-    def _create_fallback_track(self, file_path: Path) -> AudioTrack:
+    def _create_fallback_track(self, file_path: Path, file_size: Optional[int] = None) -> AudioTrack:
         """Create track with minimal info when metadata extraction fails."""
         return AudioTrack(
             file_path=file_path,
             title=file_path.stem,
             format=file_path.suffix[1:].lower(),
-            file_size=file_path.stat().st_size
+            file_size=file_path.stat().st_size if file_size is None else file_size
         )
         
+    @staticmethod
+    def _group_sorted(tracks: List[AudioTrack], key) -> Dict[str, List[AudioTrack]]:
+        """Group tracks that are already sorted by key into an ordered dict."""
+        return {name: list(group) for name, group in groupby(tracks, key=key)}
+        
     def group_by_album(self) -> Dict[str, List[AudioTrack]]:
         """Group tracks by album."""
-        groups: Dict[str, List[AudioTrack]] = {}
-        for track in self.tracks:
-            album_key = f"{track.album}"
-            if album_key not in groups:
-                groups[album_key] = []
-            groups[album_key].append(track)
-            
-        # Sort tracks within each album by track number
-        for tracks in groups.values():
-            tracks.sort(key=lambda t: t.track_number if t.track_number else 999)
-            
-        return dict(sorted(groups.items()))
+        # Sorted by album then track number
+        tracks = sorted(self.tracks, key=attrgetter('_album_sort_key'))
+        return self._group_sorted(tracks, key=attrgetter('album'))
         
     def group_by_artist(self) -> Dict[str, List[AudioTrack]]:
         """Group tracks by artist."""
-        groups: Dict[str, List[AudioTrack]] = {}
-        for track in self.tracks:
-            if track.artist not in groups:
-                groups[track.artist] = []
-            groups[track.artist].append(track)
-            
-        # Sort tracks within each artist by album then track number
-        for tracks in groups.values():
-            tracks.sort(key=lambda t: (t.album, t.track_number if t.track_number else 999))
-            
-        return dict(sorted(groups.items()))
+        # Sorted by artist, then album and track number within each artist
+        tracks = sorted(self.tracks, key=attrgetter('_artist_sort_key'))
+        return self._group_sorted(tracks, key=attrgetter('artist'))
         
     def group_by_year(self) -> Dict[str, List[AudioTrack]]:
         """Group tracks by year."""
-        groups: Dict[str, List[AudioTrack]] = {}
-        for track in self.tracks:
-            year = str(track.year).split('-')[0][:4] if track.year != "Unknown" else "Unknown"
-            if year not in groups:
-                groups[year] = []
-            groups[year].append(track)
-            
-        # Sort tracks within each year by artist then album
-        for tracks in groups.values():
-            tracks.sort(key=lambda t: (t.artist, t.album, t.track_number if t.track_number else 999))
-            
-        return dict(sorted(groups.items(), reverse=True))
+        # Newest year first; stable sort keeps artist/album order within each year
+        tracks = sorted(self.tracks, key=attrgetter('_artist_sort_key'))
+        year_of = attrgetter('_year_key')
+        tracks.sort(key=year_of, reverse=True)
+        return self._group_sorted(tracks, key=year_of)
         
     def group_by_folder(self) -> Dict[str, List[AudioTrack]]:
         """Group tracks by parent folder."""
-        groups: Dict[str, List[AudioTrack]] = {}
-        for track in self.tracks:
-            folder = track.file_path.parent.name
-            if folder not in groups:
-                groups[folder] = []
-            groups[folder].append(track)
-            
-        # Sort tracks within each folder by filename
-        for tracks in groups.values():
-            tracks.sort(key=lambda t: t.file_path.name)
-            
-        return dict(sorted(groups.items()))
+        # Sorted by folder then filename
+        tracks = sorted(self.tracks, key=attrgetter('_folder_sort_key'))
+        return self._group_sorted(tracks, key=attrgetter('_folder_key'))
@@ -0,0 +1,104 @@
+"""
+Persistent cache of scanned track metadata
+"""
+
+import logging
+import os
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+from core.audio_scanner import AudioTrack
+
+logger = logging.getLogger(__name__)
+
+
+class LibraryCache:
+    """SQLite index of track metadata keyed by (path, mtime_ns, size)."""
+
+    _cache_file = Path.home() / ".peachy-player" / "library.db"
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tracks (
+            path TEXT PRIMARY KEY,
+            mtime_ns INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            title TEXT,
+            artist TEXT,
+            album TEXT,
+            year TEXT,
+            track_number INTEGER,
+            duration REAL,
+            format TEXT,
+            album_art BLOB
+        )
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None) -> None:
+        self.cache_file = cache_file or self._cache_file
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database, creating it if needed."""
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.cache_file))
+        conn.execute(self._SCHEMA)
+        return conn
+
+    @staticmethod
+    def _path_range(root: str) -> Tuple[str, str]:
+        """Bounds of the paths under root, as a range over the primary key index."""
+        prefix = os.path.join(root, "")
+        # Every path starting with prefix sorts before prefix with its last
+        # character (the separator) bumped by one
+        return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+    def load(self, root: str) -> Dict[str, Tuple[int, int, AudioTrack]]:
+        """Load cached tracks under root as {path: (mtime_ns, size, track)}."""
+        cached: Dict[str, Tuple[int, int, AudioTrack]] = {}
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    "SELECT path, mtime_ns, size, title, artist, album, year, "
+                    "track_number, duration, format, album_art FROM tracks "
+                    "WHERE path >= ? AND path < ?",
+                    self._path_range(root)
+                )
+                for (path, mtime_ns, size, title, artist, album, year,
+                     track_number, duration, fmt, album_art) in rows:
+                    cached[path] = (mtime_ns, size, AudioTrack(
+                        file_path=Path(path),
+                        title=title,
+                        artist=artist,
+                        album=album,
+                        year=year,
+                        track_number=track_number,
+                        duration=duration,
+                        file_size=size,
+                        format=fmt,
+                        album_art_data=album_art,
+                    ))
+        except sqlite3.Error as e:
+            logger.warning("Could not load library cache: %s", e)
+        return cached
+
+    def store(self, entries: Iterable[Tuple[int, AudioTrack]],
+              removed: Iterable[str] = ()) -> None:
+        """Insert or update (mtime_ns, track) pairs and drop removed paths in one transaction."""
+        rows = [
+            (str(track.file_path), mtime_ns, track.file_size, track.title, track.artist,
+             track.album, track.year, track.track_number, track.duration, track.format,
+             track.album_art_data)
+            for mtime_ns, track in entries
+        ]
+        stale = [(path,) for path in removed]
+        if not rows and not stale:
+            return
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.executemany("DELETE FROM tracks WHERE path = ?", stale)
+                conn.executemany(
+                    "INSERT OR REPLACE INTO tracks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+        except sqlite3.Error as e:
+            logger.error("Could not update library cache: %s", e)
@@ -3,12 +3,17 @@ OS-native media key controller for Windows and Linux
 Provides integration with system media controls (SMTC on Windows, MPRIS on Linux)
 """
 
+import logging
 import sys
+import functools
 from abc import ABCMeta, abstractmethod
 from typing import Optional
 from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtWidgets import QWidget
 from core.audio_scanner import AudioTrack
 
+logger = logging.getLogger(__name__)
+
 
 def get_platform() -> str:
     """Detect current platform."""
@@ -39,6 +44,11 @@ class MediaController(QObject, metaclass=MediaControllerMeta):
     def __init__(self) -> None:
         super().__init__()
         self._is_registered = False
+        self._main_window: Optional[QWidget] = None
+        
+    def set_main_window(self, window: QWidget) -> None:
+        """Set the application's main window, for controllers that attach to it."""
+        self._main_window = window
         
     @abstractmethod
     def register(self) -> bool:
@@ -58,6 +68,10 @@ class MediaController(QObject, metaclass=MediaControllerMeta):
         """Update playback state in OS media display."""
         pass
         
+    def update_position(self, position: float) -> None:
+        """Update playback position in seconds; optional for controllers."""
+        pass
+        
     @abstractmethod
     def cleanup(self) -> None:
         """Clean up resources and unregister from OS."""
@@ -72,7 +86,7 @@ class DummyMediaController(MediaController):
     """Fallback controller that does nothing (for unsupported platforms)."""
     
     def register(self) -> bool:
-        print("MediaController: Platform not supported, using dummy controller")
+        logger.info("Platform not supported, using dummy controller")
         self._is_registered = True
         return True
         
@@ -86,23 +100,27 @@ class DummyMediaController(MediaController):
         pass
 
 
-def create_media_controller() -> MediaController:
-    """Factory function to create platform-specific media controller."""
-    platform = get_platform()
-    
-    if platform == "windows":
+_PLATFORM = get_platform()
+
+
+@functools.lru_cache(maxsize=1)
+def _controller_cls() -> type:
+    """Resolve the media controller class for this platform once."""
+    if _PLATFORM == "windows":
         try:
             from core.media_controller_windows import WindowsMediaController
-            return WindowsMediaController()
+            return WindowsMediaController
         except ImportError as e:
-            print(f"Failed to import Windows media controller: {e}")
-            return DummyMediaController()
-    elif platform == "linux":
+            logger.warning("Failed to import Windows media controller: %s", e)
+    elif _PLATFORM == "linux":
         try:
             from core.media_controller_linux import LinuxMediaController
-            return LinuxMediaController()
+            return LinuxMediaController
         except ImportError as e:
-            print(f"Failed to import Linux media controller: {e}")
-            return DummyMediaController()
-    else:
-        return DummyMediaController()
+            logger.warning("Failed to import Linux media controller: %s", e)
+    return DummyMediaController
+
+
+def create_media_controller() -> MediaController:
+    """Factory function to create platform-specific media controller."""
+    return _controller_cls()()
@@ -3,11 +3,14 @@ Linux Media Controller using MPRIS D-Bus interface
 Integrates with Linux desktop media keys and controls
 """
 
-from typing import Optional, Dict, Any
-from PySide6.QtCore import Slot, QTimer
+import logging
+from typing import Optional, Dict, Any, Set
+from PySide6.QtCore import Slot, QTimer, QAbstractEventDispatcher, QElapsedTimer
 from core.media_controller import MediaController
 from core.audio_scanner import AudioTrack
 
+logger = logging.getLogger(__name__)
+
 try:
     import dbus
     import dbus.service
@@ -15,7 +18,7 @@ try:
     DBUS_AVAILABLE = True
 except ImportError:
     DBUS_AVAILABLE = False
-    print("Warning: dbus-python not available. Linux media key support disabled.")
+    logger.warning("dbus-python not available. Linux media key support disabled.")
 
 
 class LinuxMediaController(MediaController):
@@ -24,6 +27,7 @@ class LinuxMediaController(MediaController):
     MPRIS_INTERFACE = "org.mpris.MediaPlayer2"
     MPRIS_PLAYER_INTERFACE = "org.mpris.MediaPlayer2.Player"
     MPRIS_PATH = "/org/mpris/MediaPlayer2"
+    SEEK_THRESHOLD_US = 1_000_000  # Position jumps larger than this are reported as Seeked
     
     def __init__(self) -> None:
         super().__init__()
@@ -31,12 +35,24 @@ class LinuxMediaController(MediaController):
         self._mpris_service: Optional[Any] = None
         self._current_track: Optional[AudioTrack] = None
         self._playback_status = "Stopped"
-        self._position_us = 0  # Position in microseconds
+        self._position_us = 0  # Position in microseconds at the last update
+        self._position_clock = QElapsedTimer()  # Time since the last update, counted while playing
+        self._metadata_cache: Optional[Any] = None  # dbus.Dictionary for the current track
+        self._trackid_counter = 0  # id() can be recycled, so track ids come from a counter
         
     def register(self) -> bool:
         """Register with D-Bus MPRIS."""
         if not DBUS_AVAILABLE:
-            print("LinuxMediaController: dbus-python not available")
+            logger.info("dbus-python not available")
+            return False
+            
+        # dbus-python dispatches through the default GLib main context. Qt's GLib
+        # event dispatcher iterates that context on the GUI thread, so D-Bus
+        # method calls arrive there and signal emits stay direct. Without it
+        # (e.g. QT_NO_GLIB=1) nothing would ever service the bus.
+        dispatcher = QAbstractEventDispatcher.instance()
+        if dispatcher is None or not dispatcher.inherits("QEventDispatcherGlib"):
+            logger.warning("Qt is not using the GLib event dispatcher; MPRIS disabled")
             return False
             
         try:
@@ -56,41 +72,79 @@ class LinuxMediaController(MediaController):
             self._mpris_service = MPRISService(bus_name, self)
             
             self._is_registered = True
-            print("LinuxMediaController: Successfully registered with MPRIS")
+            logger.info("Successfully registered with MPRIS")
             return True
             
         except Exception as e:
-            print(f"LinuxMediaController: Registration failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Registration failed: %s", e)
             return False
             
     def update_track(self, track: Optional[AudioTrack]) -> None:
         """Update track metadata for MPRIS."""
+        # Restarting the same file (e.g. after a seek) leaves the metadata unchanged
+        previous = self._current_track
+        if track is previous or (track and previous and track.file_path == previous.file_path):
+            return
         self._current_track = track
+        self._trackid_counter += 1
+        self._position_us = 0
+        self._position_clock.restart()
+        # Build the D-Bus metadata once per track; property reads reuse it
+        self._metadata_cache = self._build_metadata() if DBUS_AVAILABLE else None
         if self._mpris_service:
             self._mpris_service.update_metadata()
             
     def update_state(self, is_playing: bool, is_paused: bool) -> None:
         """Update playback state for MPRIS."""
         if is_playing and not is_paused:
-            self._playback_status = "Playing"
+            status = "Playing"
         elif is_paused:
-            self._playback_status = "Paused"
+            status = "Paused"
         else:
-            self._playback_status = "Stopped"
+            status = "Stopped"
             
+        # Re-asserting the current state doesn't need a D-Bus signal
+        if status == self._playback_status:
+            return
+        # Fold the running clock into the base so Position freezes while not playing
+        self._position_us = self.get_position_us()
+        self._position_clock.restart()
+        self._playback_status = status
+        
         if self._mpris_service:
             self._mpris_service.update_playback_status()
             
+    def update_position(self, position: float) -> None:
+        """Re-anchor the MPRIS position clock, reporting jumps as Seeked."""
+        position_us = int(position * 1_000_000)
+        jumped = abs(position_us - self.get_position_us()) > self.SEEK_THRESHOLD_US
+        self._position_us = position_us
+        self._position_clock.restart()
+        if jumped and self._mpris_service:
+            self._mpris_service.Seeked(dbus.Int64(position_us))
+            
+    def get_position_us(self) -> int:
+        """Current position in microseconds, extrapolated from the last update."""
+        if self._playback_status == "Playing" and self._position_clock.isValid():
+            return self._position_us + self._position_clock.elapsed() * 1000
+        return self._position_us
+        
     def get_metadata(self) -> Dict[str, Any]:
         """Get current track metadata in MPRIS format."""
+        if self._metadata_cache is None:
+            return dbus.Dictionary({}, signature='sv')
+        return self._metadata_cache
+        
+    def _build_metadata(self) -> Dict[str, Any]:
+        """Build the MPRIS metadata dictionary for the current track."""
         if not self._current_track:
-            return {}
+            return dbus.Dictionary({}, signature='sv')
             
         track = self._current_track
         metadata = {
-            "mpris:trackid": dbus.ObjectPath(f"/org/mpris/MediaPlayer2/Track/{id(track)}"),
+            "mpris:trackid": dbus.ObjectPath(
+                f"/org/mpris/MediaPlayer2/Track/{self._trackid_counter}"
+            ),
             "xesam:title": track.title or "Unknown Track",
             "xesam:artist": [track.artist or "Unknown Artist"],
             "xesam:album": track.album or "Unknown Album",
@@ -99,15 +153,16 @@ class LinuxMediaController(MediaController):
         if track.file_path:
             metadata["xesam:url"] = str(track.file_path.as_uri())
             
-        return metadata
+        return dbus.Dictionary(metadata, signature='sv')
         
     def cleanup(self) -> None:
         """Clean up D-Bus resources."""
         if self._mpris_service:
+            self._mpris_service.cancel_pending()
             self._mpris_service.remove_from_connection()
             self._mpris_service = None
         self._bus = None
-        print("LinuxMediaController: Cleaned up")
+        logger.info("Cleaned up")
 
 
 if DBUS_AVAILABLE:
@@ -118,6 +173,33 @@ if DBUS_AVAILABLE:
             super().__init__(bus_name, LinuxMediaController.MPRIS_PATH)
             self.controller = controller
             
+            # Property values are prebuilt once; only PlaybackStatus and Metadata
+            # are replaced, in place, when they change
+            self._player_properties = dbus.Dictionary({
+                "PlaybackStatus": dbus.String(controller._playback_status),
+                "Metadata": controller.get_metadata(),
+                "CanPlay": dbus.Boolean(True),
+                "CanPause": dbus.Boolean(True),
+                "CanGoNext": dbus.Boolean(True),
+                "CanGoPrevious": dbus.Boolean(True),
+            }, signature='sv')
+            self._properties: Dict[str, Any] = {
+                LinuxMediaController.MPRIS_INTERFACE: dbus.Dictionary({
+                    "Identity": dbus.String("Desktop Music Player"),
+                    "CanQuit": dbus.Boolean(True),
+                    "CanRaise": dbus.Boolean(True),
+                }, signature='sv'),
+                LinuxMediaController.MPRIS_PLAYER_INTERFACE: self._player_properties,
+            }
+            
+            # Property changes made in the same event loop pass go out as one signal
+            self._pending_changes: Dict[str, Any] = {}
+            self._pending_invalidated: Set[str] = set()
+            self._flush_timer = QTimer()
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.setInterval(0)
+            self._flush_timer.timeout.connect(self._flush_changes)
+            
         # org.mpris.MediaPlayer2 interface
         @dbus.service.method(LinuxMediaController.MPRIS_INTERFACE)
         def Raise(self) -> None:
@@ -133,101 +215,102 @@ if DBUS_AVAILABLE:
         @dbus.service.method(LinuxMediaController.MPRIS_PLAYER_INTERFACE)
         def Play(self) -> None:
             """Handle Play command."""
-            print("LinuxMediaController: Play command received")
+            logger.debug("Play command received")
             self.controller.play_pause_requested.emit()
             
         @dbus.service.method(LinuxMediaController.MPRIS_PLAYER_INTERFACE)
         def Pause(self) -> None:
             """Handle Pause command."""
-            print("LinuxMediaController: Pause command received")
+            logger.debug("Pause command received")
             self.controller.play_pause_requested.emit()
             
         @dbus.service.method(LinuxMediaController.MPRIS_PLAYER_INTERFACE)
         def PlayPause(self) -> None:
             """Handle PlayPause command."""
-            print("LinuxMediaController: PlayPause command received")
+            logger.debug("PlayPause command received")
             self.controller.play_pause_requested.emit()
             
         @dbus.service.method(LinuxMediaController.MPRIS_PLAYER_INTERFACE)
         def Next(self) -> None:
             """Handle Next command."""
-            print("LinuxMediaController: Next command received")
+            logger.debug("Next command received")
             self.controller.next_requested.emit()
             
         @dbus.service.method(LinuxMediaController.MPRIS_PLAYER_INTERFACE)
         def Previous(self) -> None:
             """Handle Previous command."""
-            print("LinuxMediaController: Previous command received")
+            logger.debug("Previous command received")
             self.controller.previous_requested.emit()
             
         @dbus.service.method(LinuxMediaController.MPRIS_PLAYER_INTERFACE)
         def Stop(self) -> None:
             """Handle Stop command."""
-            print("LinuxMediaController: Stop command received")
+            logger.debug("Stop command received")
             self.controller.stop_requested.emit()
             
         # Properties
         @dbus.service.method(dbus.PROPERTIES_IFACE, in_signature='ss', out_signature='v')
         def Get(self, interface: str, prop: str) -> Any:
             """Get property value."""
-            if interface == LinuxMediaController.MPRIS_PLAYER_INTERFACE:
-                if prop == "PlaybackStatus":
-                    return self.controller._playback_status
-                elif prop == "Metadata":
-                    return dbus.Dictionary(self.controller.get_metadata(), signature='sv')
-                elif prop == "CanPlay":
-                    return True
-                elif prop == "CanPause":
-                    return True
-                elif prop == "CanGoNext":
-                    return True
-                elif prop == "CanGoPrevious":
-                    return True
-            elif interface == LinuxMediaController.MPRIS_INTERFACE:
-                if prop == "Identity":
-                    return "Desktop Music Player"
-                elif prop == "CanQuit":
-                    return True
-                elif prop == "CanRaise":
-                    return True
-            return None
+            if prop == "Position" and interface == LinuxMediaController.MPRIS_PLAYER_INTERFACE:
+                return dbus.Int64(self.controller.get_position_us())
+            return self._properties.get(interface, {}).get(prop)
             
         @dbus.service.method(dbus.PROPERTIES_IFACE, in_signature='s', out_signature='a{sv}')
         def GetAll(self, interface: str) -> Dict[str, Any]:
             """Get all properties for interface."""
             if interface == LinuxMediaController.MPRIS_PLAYER_INTERFACE:
-                return {
-                    "PlaybackStatus": self.controller._playback_status,
-                    "Metadata": dbus.Dictionary(self.controller.get_metadata(), signature='sv'),
-                    "CanPlay": True,
-                    "CanPause": True,
-                    "CanGoNext": True,
-                    "CanGoPrevious": True,
-                }
-            elif interface == LinuxMediaController.MPRIS_INTERFACE:
-                return {
-                    "Identity": "Desktop Music Player",
-                    "CanQuit": True,
-                    "CanRaise": True,
-                }
-            return {}
+                # Position changes continuously, so it is never cached or signalled
+                self._player_properties["Position"] = dbus.Int64(self.controller.get_position_us())
+            return self._properties.get(interface, {})
             
         def update_metadata(self) -> None:
-            """Emit metadata changed signal."""
-            self.PropertiesChanged(
-                LinuxMediaController.MPRIS_PLAYER_INTERFACE,
-                {"Metadata": dbus.Dictionary(self.controller.get_metadata(), signature='sv')},
-                []
-            )
+            """Queue a metadata invalidation; clients re-Get it only if they need it."""
+            self._player_properties["Metadata"] = self.controller.get_metadata()
+            self._pending_changes.pop("Metadata", None)
+            self._pending_invalidated.add("Metadata")
+            self._schedule_flush()
             
         def update_playback_status(self) -> None:
-            """Emit playback status changed signal."""
+            """Queue a playback status change notification."""
+            status = dbus.String(self.controller._playback_status)
+            self._player_properties["PlaybackStatus"] = status
+            self._queue_change("PlaybackStatus", status)
+            
+        def _queue_change(self, prop: str, value: Any) -> None:
+            """Record a changed property and schedule a coalesced PropertiesChanged."""
+            self._pending_invalidated.discard(prop)
+            self._pending_changes[prop] = value
+            self._schedule_flush()
+            
+        def _schedule_flush(self) -> None:
+            """Start the flush timer unless a flush is already pending."""
+            if not self._flush_timer.isActive():
+                self._flush_timer.start()
+                
+        def _flush_changes(self) -> None:
+            """Emit all pending property changes in a single signal."""
+            if not self._pending_changes and not self._pending_invalidated:
+                return
+            changed = dbus.Dictionary(self._pending_changes, signature='sv')
+            invalidated = dbus.Array(sorted(self._pending_invalidated), signature='s')
+            self._pending_changes = {}
+            self._pending_invalidated = set()
             self.PropertiesChanged(
-                LinuxMediaController.MPRIS_PLAYER_INTERFACE,
-                {"PlaybackStatus": self.controller._playback_status},
-                []
+                LinuxMediaController.MPRIS_PLAYER_INTERFACE, changed, invalidated
             )
             
+        def cancel_pending(self) -> None:
+            """Stop the flush timer and drop changes that were not yet emitted."""
+            self._flush_timer.stop()
+            self._pending_changes = {}
+            self._pending_invalidated = set()
+            
+        @dbus.service.signal(LinuxMediaController.MPRIS_PLAYER_INTERFACE, signature='x')
+        def Seeked(self, position: int) -> None:
+            """Signal that the position jumped, in microseconds."""
+            pass
+            
         @dbus.service.signal(dbus.PROPERTIES_IFACE, signature='sa{sv}as')
         def PropertiesChanged(self, interface: str, changed: Dict[str, Any], invalidated: list) -> None:
             """Signal for property changes."""
@@ -3,13 +3,14 @@ Windows Media Controller using native Windows messages
 Intercepts WM_APPCOMMAND to catch all media key events including user-configured shortcuts
 """
 
+import logging
 from typing import Optional
-from PySide6.QtCore import Slot, QObject, QEvent
-from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QShortcut, QKeySequence
+from PySide6.QtCore import Slot, QObject
 from core.media_controller import MediaController
 from core.audio_scanner import AudioTrack
 
+logger = logging.getLogger(__name__)
+
 
 # Windows WM_APPCOMMAND constants
 WM_APPCOMMAND = 0x0319
@@ -24,89 +25,34 @@ APPCOMMAND_MEDIA_PAUSE = 47
 class WindowsMediaController(MediaController, QObject):
     """Windows implementation using native message handling for media keys."""
     
+    # APPCOMMAND code -> name of the signal it triggers
+    _CMD_TABLE = {
+        APPCOMMAND_MEDIA_PLAY_PAUSE: 'play_pause_requested',
+        APPCOMMAND_MEDIA_PLAY: 'play_pause_requested',
+        APPCOMMAND_MEDIA_PAUSE: 'play_pause_requested',
+        APPCOMMAND_MEDIA_NEXTTRACK: 'next_requested',
+        APPCOMMAND_MEDIA_PREVIOUSTRACK: 'previous_requested',
+        APPCOMMAND_MEDIA_STOP: 'stop_requested',
+    }
+    
     def __init__(self) -> None:
         # Call both parent constructors properly
         super().__init__()  # This calls MediaController.__init__ which calls QObject.__init__
         self._current_track: Optional[AudioTrack] = None
-        self._shortcuts = []
-        self._main_window = None
         
     def register(self) -> bool:
-        """Register native Windows message handler for media keys."""
-        try:
-            # Get the main window
-            self._main_window = None
-            for widget in QApplication.topLevelWidgets():
-                if widget.isWindow():
-                    self._main_window = widget
-                    break
-                    
-            if not self._main_window:
-                print("WindowsMediaController: No window found")
-                return False
-            
-            print(f"WindowsMediaController: Installing native event filter for WM_APPCOMMAND...")
-            
-            # Install native event filter to catch WM_APPCOMMAND messages
-            # This catches ALL media key events including user-configured shortcuts
-            self._main_window.installEventFilter(self)
-            
-            # Also register Qt shortcuts as fallback for hardware media keys
-            self._register_qt_shortcuts()
-            
-            self._is_registered = True
-            print(f"WindowsMediaController: Successfully registered media key handler")
-            return True
-            
-        except Exception as e:
-            print(f"WindowsMediaController: Registration failed: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
-            
-    def _register_qt_shortcuts(self) -> None:
-        """Register Qt shortcuts as fallback for hardware media keys."""
+        """Register for media keys delivered to the main window."""
+        # Media keys arrive as WM_APPCOMMAND through MainWindow.nativeEvent, which
+        # forwards them to handle_windows_message; no Qt shortcuts or event
+        # filters are needed on top of that
         if not self._main_window:
-            return
-            
-        try:
-            # These work for keyboards with dedicated media keys
-            shortcuts_map = [
-                ("Media Play", self.play_pause_requested),
-                ("Media Pause", self.play_pause_requested),
-                ("Media Toggle Play Pause", self.play_pause_requested),
-                ("Media Next", self.next_requested),
-                ("Media Previous", self.previous_requested),
-                ("Media Stop", self.stop_requested),
-            ]
-            
-            for key_seq, signal in shortcuts_map:
-                shortcut = QShortcut(QKeySequence(key_seq), self._main_window)
-                shortcut.activated.connect(signal.emit)
-                self._shortcuts.append(shortcut)
-                
-            print(f"WindowsMediaController: Registered {len(self._shortcuts)} Qt shortcuts as fallback")
-        except Exception as e:
-            print(f"WindowsMediaController: Qt shortcuts registration failed: {e}")
-            
-    def eventFilter(self, obj, event) -> bool:
-        """Qt event filter to intercept native Windows messages."""
-        try:
-            # Check if this is a native event (Windows message)
-            if event.type() == QEvent.Type.NativeGesture:
-                # On Windows, we need to check for WM_APPCOMMAND
-                pass
-                
-            # PySide6 doesn't expose nativeEvent directly like PyQt5 does
-            # but we can use winEvent on Windows
-            # The event filter approach may not catch WM_APPCOMMAND directly
-            # Let's override nativeEvent in the main window instead
+            logger.warning("No main window set")
+            return False
             
-        except Exception as e:
-            pass
+        self._is_registered = True
+        logger.info("Successfully registered media key handler")
+        return True
             
-        return False  # Don't filter the event
-        
     def handle_windows_message(self, msg, wparam, lparam) -> bool:
         """
         Handle Windows WM_APPCOMMAND messages.
@@ -116,57 +62,27 @@ class WindowsMediaController(MediaController, QObject):
             # Extract the command from lparam
             cmd = (lparam >> 16) & 0xFFF
             
-            print(f"WindowsMediaController: Received WM_APPCOMMAND with code: {cmd}")
+            logger.debug("Received WM_APPCOMMAND with code: %d", cmd)
             
-            if cmd == APPCOMMAND_MEDIA_PLAY_PAUSE:
-                print("WindowsMediaController: Play/Pause command (14)")
-                self.play_pause_requested.emit()
-                return True
-            elif cmd == APPCOMMAND_MEDIA_PLAY:
-                print("WindowsMediaController: Play command (46)")
-                self.play_pause_requested.emit()
+            signal_name = self._CMD_TABLE.get(cmd)
+            if signal_name:
+                getattr(self, signal_name).emit()
                 return True
-            elif cmd == APPCOMMAND_MEDIA_PAUSE:
-                print("WindowsMediaController: Pause command (47)")
-                self.play_pause_requested.emit()
-                return True
-            elif cmd == APPCOMMAND_MEDIA_NEXTTRACK:
-                print("WindowsMediaController: Next command (11)")
-                self.next_requested.emit()
-                return True
-            elif cmd == APPCOMMAND_MEDIA_PREVIOUSTRACK:
-                print("WindowsMediaController: Previous command (12)")
-                self.previous_requested.emit()
-                return True
-            elif cmd == APPCOMMAND_MEDIA_STOP:
-                print("WindowsMediaController: Stop command (13)")
-                self.stop_requested.emit()
-                return True
-            else:
-                # Log unhandled command codes for debugging
-                print(f"WindowsMediaController: Unhandled APPCOMMAND code: {cmd}")
+            # Log unhandled command codes for debugging
+            logger.debug("Unhandled APPCOMMAND code: %d", cmd)
                 
         return False
             
     def update_track(self, track: Optional[AudioTrack]) -> None:
-        """Update track metadata (not supported with Qt shortcuts)."""
+        """Update track metadata (not supported with WM_APPCOMMAND)."""
         self._current_track = track
         if track:
-            print(f"WindowsMediaController: Now playing: {track.title} by {track.artist}")
+            logger.debug("Now playing: %s by %s", track.title, track.artist)
             
     def update_state(self, is_playing: bool, is_paused: bool) -> None:
-        """Update playback state (not supported with Qt shortcuts)."""
+        """Update playback state (not supported with WM_APPCOMMAND)."""
         pass
             
     def cleanup(self) -> None:
-        """Clean up shortcuts and event filters."""
-        try:
-            if self._main_window:
-                self._main_window.removeEventFilter(self)
-            for shortcut in self._shortcuts:
-                shortcut.setEnabled(False)
-            self._shortcuts.clear()
-            print("WindowsMediaController: Cleaned up")
-        except Exception as e:
-            print(f"WindowsMediaController: Cleanup error: {e}")
-
+        """Nothing to release; messages stop with the main window."""
+        logger.info("Cleaned up")
@@ -2,11 +2,24 @@
 Queue manager for playback queue operations
 """
 
-from typing import List, Optional, Dict, Any
+import logging
+import os
+from operator import attrgetter
+from collections import deque
+from itertools import islice
+from typing import List, Optional, Dict, Any, Deque, Set, Tuple
 from PySide6.QtCore import QObject, Signal
-from core.audio_scanner import AudioTrack, AudioScanner
+from core.audio_scanner import AudioTrack
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Metadata fields persisted alongside the file path, fetched in one call per track
+_TRACK_FIELD_NAMES = (
+    'title', 'artist', 'album', 'year', 'track_number', 'duration', 'file_size', 'format'
+)
+_track_fields = attrgetter(*_TRACK_FIELD_NAMES)
+
 
 class QueueManager(QObject):
     """Manages the playback queue with add, remove, and reorder operations."""
@@ -18,30 +31,58 @@ class QueueManager(QObject):
     
     def __init__(self) -> None:
         super().__init__()
-        self._queue: List[AudioTrack] = []
+        self._queue: Deque[AudioTrack] = deque()
         self._current_index: int = -1
+        # file_path -> first queue index, rebuilt lazily after the queue changes
+        self._path_index: Optional[Dict[Path, int]] = None
+        # Read-only tuple of the queue, rebuilt lazily after the queue changes
+        self._snapshot: Optional[Tuple[AudioTrack, ...]] = None
+        
+    def _invalidate(self) -> None:
+        """Drop views derived from the queue after it is mutated."""
+        self._path_index = None
+        self._snapshot = None
+        
+    def _pop(self, index: int) -> AudioTrack:
+        """Remove and return the track at index; O(1) at either end of the queue."""
+        track = self._queue[index]
+        del self._queue[index]
+        self._invalidate()
+        return track
         
     def add_track(self, track: AudioTrack) -> None:
         """Add a single track to the end of the queue."""
         self._queue.append(track)
+        self._invalidate()
         self.track_added.emit(track)
         self.queue_changed.emit()
         
-    def add_tracks(self, tracks: List[AudioTrack]) -> None:
-        """Add multiple tracks to the end of the queue."""
+    def add_tracks(self, tracks: List[AudioTrack], start_if_empty: bool = False) -> None:
+        """Add multiple tracks to the end of the queue.
+        
+        With start_if_empty, the first added track becomes current when the
+        queue was empty, in the same update as the add.
+        """
         if not tracks:
             return
+        was_empty = not self._queue
         self._queue.extend(tracks)
+        self._invalidate()
+        if start_if_empty and was_empty:
+            self._current_index = 0
         for track in tracks:
             self.track_added.emit(track)
         self.queue_changed.emit()
+        if start_if_empty and was_empty:
+            self.current_track_changed.emit(self._queue[0])
         
     def insert_track(self, index: int, track: AudioTrack) -> None:
         """Insert a track at a specific position."""
         if 0 <= index <= len(self._queue):
             self._queue.insert(index, track)
-            # Adjust current index if needed
-            if index <= self._current_index:
+            self._invalidate()
+            # Inserting at or before the current track shifts it down by one
+            if 0 <= self._current_index and index <= self._current_index:
                 self._current_index += 1
             self.track_added.emit(track)
             self.queue_changed.emit()
@@ -49,7 +90,7 @@ class QueueManager(QObject):
     def remove_track(self, index: int) -> Optional[AudioTrack]:
         """Remove track at specified index."""
         if 0 <= index < len(self._queue):
-            track = self._queue.pop(index)
+            track = self._pop(index)
             # Adjust current index if needed
             if index < self._current_index:
                 self._current_index -= 1
@@ -67,8 +108,9 @@ class QueueManager(QObject):
             0 <= to_index < len(self._queue) and 
             from_index != to_index):
             
-            track = self._queue.pop(from_index)
+            track = self._pop(from_index)
             self._queue.insert(to_index, track)
+            self._invalidate()
             
             # Adjust current index if needed
             if self._current_index == from_index:
@@ -85,13 +127,20 @@ class QueueManager(QObject):
     def clear_queue(self) -> None:
         """Clear all tracks from the queue."""
         self._queue.clear()
+        self._invalidate()
         self._current_index = -1
         self.current_track_changed.emit(None)
         self.queue_changed.emit()
         
     def get_queue(self) -> List[AudioTrack]:
         """Get a copy of the current queue."""
-        return self._queue.copy()
+        return list(self._queue)
+        
+    def iter_queue(self) -> Tuple[AudioTrack, ...]:
+        """Get the queue as a shared tuple; use this instead of get_queue() to only read it."""
+        if self._snapshot is None:
+            self._snapshot = tuple(self._queue)
+        return self._snapshot
         
     def get_track(self, index: int) -> Optional[AudioTrack]:
         """Get track at specified index."""
@@ -99,6 +148,14 @@ class QueueManager(QObject):
             return self._queue[index]
         return None
         
+    def index_of(self, file_path: Path) -> Optional[int]:
+        """Get the index of the first queued track with this file path."""
+        if self._path_index is None:
+            self._path_index = {}
+            for index, track in enumerate(self._queue):
+                self._path_index.setdefault(track.file_path, index)
+        return self._path_index.get(file_path)
+        
     def get_current_track(self) -> Optional[AudioTrack]:
         """Get the currently playing track."""
         if 0 <= self._current_index < len(self._queue):
@@ -112,8 +169,13 @@ class QueueManager(QObject):
     def set_current_index(self, index: int) -> None:
         """Set the currently playing track by index."""
         if -1 <= index < len(self._queue):
+            previous = self.get_current_track()
+            unchanged = index == self._current_index
             self._current_index = index
             track = self.get_current_track()
+            # Re-selecting the current track would only make listeners rebuild
+            if unchanged and track is previous:
+                return
             self.current_track_changed.emit(track)
         
     def next_track(self) -> Optional[AudioTrack]:
@@ -146,7 +208,7 @@ class QueueManager(QObject):
         """Remove the currently playing track and move to next."""
         if 0 <= self._current_index < len(self._queue):
             current_idx = self._current_index
-            track = self._queue.pop(current_idx)
+            track = self._pop(current_idx)
             
             # Don't increment current_index, as removal shifts items down
             # If we were at the last track, move back
@@ -173,46 +235,31 @@ class QueueManager(QObject):
         """Get tracks that are up next (after current track)."""
         if self._current_index < 0 or self._current_index >= len(self._queue) - 1:
             return []
-        return self._queue[self._current_index + 1:].copy()
+        return list(islice(self._queue, self._current_index + 1, None))
     
     def get_just_played(self) -> List[AudioTrack]:
         """Get tracks that have been played (including current track)."""
         if self._current_index < 0:
             return []
-        return self._queue[:self._current_index + 1].copy()
+        return list(islice(self._queue, self._current_index + 1))
     
     def serialize(self) -> List[Dict[str, Any]]:
         """Serialize queue to a list of dictionaries for persistence."""
-        serialized = []
-        for track in self._queue:
-            serialized.append({
-                'file_path': str(track.file_path),
-                'title': track.title,
-                'artist': track.artist,
-                'album': track.album,
-                'year': track.year,
-                'track_number': track.track_number,
-                'duration': track.duration,
-                'file_size': track.file_size,
-                'format': track.format,
-            })
-        return serialized
+        return [
+            {'file_path': str(track.file_path), **dict(zip(_TRACK_FIELD_NAMES, _track_fields(track)))}
+            for track in self._queue
+        ]
     
     def restore(self, serialized_queue: List[Dict[str, Any]], current_index: int) -> None:
         """Restore queue from serialized data."""
         self._queue.clear()
-        scanner = AudioScanner()  # For extracting album art
+        self._invalidate()
         
+        tracks: List[AudioTrack] = []
         for track_data in serialized_queue:
             try:
-                file_path = Path(track_data['file_path'])
-                
-                # Only add if file still exists
-                if not file_path.exists():
-                    continue
-                    
-                track = AudioTrack(
-                    file_path=file_path,
+                tracks.append(AudioTrack(
+                    file_path=Path(track_data['file_path']),
                     title=track_data.get('title', 'Unknown Title'),
                     artist=track_data.get('artist', 'Unknown Artist'),
                     album=track_data.get('album', 'Unknown Album'),
@@ -221,14 +268,25 @@ class QueueManager(QObject):
                     duration=track_data.get('duration', 0.0),
                     file_size=track_data.get('file_size', 0),
                     format=track_data.get('format', 'unknown'),
-                )
-                
-                # Re-extract album art from the file
-                track.album_art_data = scanner._extract_album_art(file_path)
+                ))
+            except Exception as e:
+                logger.warning("Could not restore track: %s", e)
                 
+        # Only add tracks whose file still exists, checked with one directory
+        # listing per folder rather than a stat per track. Album art is read
+        # when a track is first displayed rather than for the whole queue
+        listings: Dict[Path, Set[str]] = {}
+        for track in tracks:
+            parent = track.file_path.parent
+            if parent not in listings:
+                try:
+                    with os.scandir(parent) as it:
+                        listings[parent] = {entry.name for entry in it}
+                except OSError:
+                    listings[parent] = set()
+            if track.file_path.name in listings[parent]:
+                track.defer_album_art()
                 self._queue.append(track)
-            except Exception as e:
-                print(f"Could not restore track: {e}")
         
         # Set current index if valid
         if 0 <= current_index < len(self._queue):
@@ -2,30 +2,55 @@
 Application settings manager with persistent storage
 """
 
+import logging
+import atexit
+import functools
 import json
+import os
 from pathlib import Path
 from typing import Optional, List, Dict, Any
+from PySide6.QtCore import QCoreApplication, QTimer
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON, using orjson when it is installed."""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
 
 
 class Settings:
     """Manage application settings with JSON persistence."""
     
-    _instance = None
     _settings_file = Path.home() / ".peachy-player" / "settings.json"
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    # The queue can be large, so it lives in its own file written only on save_queue_state()
+    _queue_file = _settings_file.with_name("queue.json")
+    SAVE_DELAY_MS = 500  # Bursts of changes within this window are written once
     
     def __init__(self) -> None:
-        if self._initialized:
-            return
-        self._initialized = True
         self._data = {}
+        self._dirty = False
+        self._last_saved: Optional[bytes] = None  # Contents last written to disk
+        self._save_timer: Optional[QTimer] = None
+        self._queue_state: Dict[str, Any] = {"queue": [], "current_queue_index": -1}
         self._ensure_settings_dir()
         self._load()
+        self._load_queue()
+        # Don't lose a pending debounced write if the app exits first
+        atexit.register(self.flush)
     
     def _ensure_settings_dir(self) -> None:
         """Create settings directory if it doesn't exist."""
@@ -35,30 +60,76 @@ class Settings:
         """Load settings from file."""
         if self._settings_file.exists():
             try:
-                with open(self._settings_file, 'r', encoding='utf-8') as f:
-                    self._data = json.load(f)
+                with open(self._settings_file, 'rb') as f:
+                    self._data = _loads(f.read())
             except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load settings: {e}")
+                logger.warning("Could not load settings: %s", e)
                 self._data = {}
         else:
             self._data = {}
+        self._last_saved = _dumps(self._data, indent=True)
+    
+    def _load_queue(self) -> None:
+        """Load the saved queue, moving it out of settings.json if an older version put it there."""
+        if self._queue_file.exists():
+            try:
+                with open(self._queue_file, 'rb') as f:
+                    self._queue_state.update(_loads(f.read()))
+            except (json.JSONDecodeError, IOError) as e:
+                logger.warning("Could not load queue: %s", e)
+        elif "queue" in self._data:
+            self.save_queue_state(
+                self._data.pop("queue"), self._data.pop("current_queue_index", -1)
+            )
+            self._dirty = True
+    
+    @staticmethod
+    def _write_atomic(path: Path, contents: bytes) -> None:
+        """Write contents to a temp file and move it over path."""
+        tmp_file = path.with_name(path.name + ".tmp")
+        with open(tmp_file, 'wb') as f:
+            f.write(contents)
+        os.replace(tmp_file, path)
     
     def _save(self) -> None:
-        """Save settings to file."""
+        """Save settings to file atomically, skipping writes that change nothing."""
+        self._dirty = False
+        contents = _dumps(self._data, indent=True)
+        if contents == self._last_saved:
+            return
         try:
-            with open(self._settings_file, 'w', encoding='utf-8') as f:
-                json.dump(self._data, f, indent=2, ensure_ascii=False)
-        except IOError as e:
-            print(f"Error: Could not save settings: {e}")
+            self._write_atomic(self._settings_file, contents)
+            self._last_saved = contents
+        except OSError as e:
+            logger.error("Could not save settings: %s", e)
+    
+    def _schedule_save(self) -> None:
+        """Mark settings dirty and (re)start the debounced save timer."""
+        self._dirty = True
+        if QCoreApplication.instance() is None:
+            # No event loop to run the timer (e.g. scripts), so write now
+            self._save()
+            return
+        if self._save_timer is None:
+            self._save_timer = QTimer()
+            self._save_timer.setSingleShot(True)
+            self._save_timer.setInterval(self.SAVE_DELAY_MS)
+            self._save_timer.timeout.connect(self.flush)
+        self._save_timer.start()
+    
+    def flush(self) -> None:
+        """Write pending changes to disk immediately."""
+        if self._dirty:
+            self._save()
     
     def get(self, key: str, default=None):
         """Get a setting value."""
         return self._data.get(key, default)
     
     def set(self, key: str, value) -> None:
-        """Set a setting value and save."""
+        """Set a setting value and schedule a save."""
         self._data[key] = value
-        self._save()
+        self._schedule_save()
     
     def get_music_folder(self) -> Optional[str]:
         """Get the configured music folder path."""
@@ -72,20 +143,28 @@ class Settings:
         """Clear the music folder setting."""
         if "music_folder" in self._data:
             del self._data["music_folder"]
-            self._save()
+            self._schedule_save()
     
     def get_queue(self) -> List[Dict[str, Any]]:
         """Get the saved queue."""
-        return self.get("queue", [])
-    
-    def set_queue(self, queue_data: List[Dict[str, Any]]) -> None:
-        """Save the queue data."""
-        self.set("queue", queue_data)
+        return self._queue_state["queue"]
     
     def get_current_queue_index(self) -> int:
         """Get the saved current queue index."""
-        return self.get("current_queue_index", -1)
+        return self._queue_state["current_queue_index"]
     
-    def set_current_queue_index(self, index: int) -> None:
-        """Save the current queue index."""
-        self.set("current_queue_index", index)
+    def save_queue_state(self, queue_data: List[Dict[str, Any]], index: int) -> None:
+        """Write the queue and current index to the queue file."""
+        self._queue_state = {"queue": queue_data, "current_queue_index": index}
+        try:
+            self._write_atomic(
+                self._queue_file, _dumps(self._queue_state)
+            )
+        except OSError as e:
+            logger.error("Could not save queue: %s", e)
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the shared Settings instance, loading it on first use."""
+    return Settings()
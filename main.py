@@ -3,16 +3,24 @@ Desktop Music Player - Main Entry Point
 Cross-platform audio player with real-time visualization
 """
 
+import logging
 import sys
+from typing import Optional
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import QTimer
 from ui.loading_screen import LoadingScreen
 from ui.main_window import MainWindow
 from ui.themes import font_manager
 
+logger = logging.getLogger(__name__)
+
 
 def main() -> int:
     """Initialize and run the application."""
+    # Debug and info messages are not even formatted unless the level is lowered
+    logging.basicConfig(level=logging.WARNING, format="%(name)s: %(message)s")
+    logger.info("Starting Desktop Music Player...")
+    
     app = QApplication(sys.argv)
     app.setApplicationName("Desktop Music Player")
     app.setOrganizationName("DesktopMusicPlayer")
@@ -20,22 +28,30 @@ def main() -> int:
     # Load custom fonts AFTER QApplication is initialized
     font_manager.load_fonts()
     
-    # Create main window (hidden initially)
-    main_window = MainWindow()
-    main_window.center_on_screen()
-    
     # Create and show loading screen
     loading = LoadingScreen()
     loading.center_on_screen()
     loading.show()
     
+    main_window: Optional[MainWindow] = None
+    
+    def build_main_window() -> None:
+        """Create the main window (hidden) once the loading screen has painted."""
+        nonlocal main_window
+        main_window = MainWindow()
+        main_window.center_on_screen()
+    
     def on_loading_complete() -> None:
         """Transition from loading to main window."""
         loading.close()
+        main_window.home_screen.initialize()
         main_window.show()
     
     loading.loading_complete.connect(on_loading_complete)
     
+    # Building the window reads the saved settings and starts the library
+    # scan, so do it behind the loading screen rather than before it appears
+    QTimer.singleShot(0, build_main_window)
     # Start loading after event loop begins
     QTimer.singleShot(100, loading.start_loading)
     
@@ -43,5 +59,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    print("Starting Desktop Music Player...")
     sys.exit(main())
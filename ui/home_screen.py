@@ -2,21 +2,37 @@
 Home screen widget - main 3-column interface
 """
 
-from typing import Optional
-from PySide6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel
-from PySide6.QtCore import Qt
-from ui.themes import FontManager
+import logging
+from typing import Callable, Optional, TYPE_CHECKING
+from PySide6.QtWidgets import QWidget, QHBoxLayout
+from PySide6.QtCore import Qt, QTimer, QRunnable, QThreadPool
 from ui.themes.colors import BG_SIDEBAR, BG_DEEP_PURPLE
-from ui.widgets import Panel, SectionHeader
+from ui.widgets import Panel
 from ui.widgets.library_panel import LibraryPanel
-from ui.widgets.queue_widget import QueueWidget
-from ui.widgets.now_playing_widget import NowPlayingWidget
-from ui.widgets.playback_controls_widget import PlaybackControlsWidget
-from ui.mini_player_window import MiniPlayerWindow
 from core.queue_manager import QueueManager
-from core.audio_engine import AudioEngine
-from core.settings import Settings
-from core.media_controller import create_media_controller
+from core.settings import get_settings
+
+if TYPE_CHECKING:
+    from core.media_controller import MediaController
+    from ui.mini_player_window import MiniPlayerWindow
+
+logger = logging.getLogger(__name__)
+
+# How long to stop sending media controller updates after one fails
+MEDIA_RETRY_MS = 30_000
+
+
+class _SaveQueueTask(QRunnable):
+    """Writes a serialized queue snapshot to disk off the GUI thread."""
+    
+    def __init__(self, settings, queue_data: list, index: int) -> None:
+        super().__init__()
+        self._settings = settings
+        self._queue_data = queue_data
+        self._index = index
+        
+    def run(self) -> None:
+        self._settings.save_queue_state(self._queue_data, self._index)
 
 
 class HomeScreen(QWidget):
@@ -26,16 +42,53 @@ class HomeScreen(QWidget):
         super().__init__()
         self.setAttribute(Qt.WA_StyledBackground, True)
         self.queue_manager = QueueManager()
-        self.audio_engine = AudioEngine()
-        self.settings = Settings()
-        self.media_controller = create_media_controller()
-        self.mini_player: Optional[MiniPlayerWindow] = None
+        self.settings = get_settings()
+        # Created in _setup_media_controller, after the window is on screen
+        self.media_controller: Optional['MediaController'] = None
+        self._media_broken = False
+        self._media_setup_done = False
+        self.mini_player: Optional['MiniPlayerWindow'] = None
+        self._initialized = False
+        self._queue_restored = False
+        # A single worker keeps queue writes in submission order
+        self._io_pool = QThreadPool(self)
+        self._io_pool.setMaxThreadCount(1)
         self._setup_ui()
+        
+    def initialize(self) -> None:
+        """Build the queue and playing columns and start the audio engine, once."""
+        if self._initialized:
+            return
+        self._initialized = True
+        
+        from core.audio_engine import AudioEngine
+        self.audio_engine = AudioEngine()
+        
+        # Swap the placeholders for the real columns; replaceWidget keeps the stretch
+        layout = self.layout()
+        queue_panel = self._create_queue_panel()
+        layout.replaceWidget(self.queue_panel, queue_panel)
+        self.queue_panel.deleteLater()
+        self.queue_panel = queue_panel
+        
+        playing_panel = self._create_playing_panel()
+        layout.replaceWidget(self.playing_panel, playing_panel)
+        self.playing_panel.deleteLater()
+        self.playing_panel = playing_panel
+        
         self._connect_audio_signals()
-        # Delay media controller setup until window is shown
-        from PySide6.QtCore import QTimer
-        QTimer.singleShot(500, self._setup_media_controller)
-        self._restore_queue()
+        # Rebuilding the saved queue checks every folder on disk, so leave it
+        # until the window has been shown rather than holding up first paint
+        QTimer.singleShot(0, self._restore_queue)
+        
+    def showEvent(self, event) -> None:
+        """Make sure the deferred columns exist before the first paint."""
+        self.initialize()
+        super().showEvent(event)
+        if not self._media_setup_done:
+            # Register media keys once the window exists, after its first paint
+            self._media_setup_done = True
+            QTimer.singleShot(0, self._setup_media_controller)
         
     def _setup_ui(self) -> None:
         """Initialize main 3-column layout."""
@@ -52,24 +105,26 @@ class HomeScreen(QWidget):
         main_layout.addWidget(self.library_panel, 25)
         
         # Middle Column - Queue (50%) - #f8edeb
-        self.queue_panel = self._create_queue_panel()
+        # Both remaining columns are empty placeholders until initialize()
+        # builds their widget trees and the audio engine behind them
+        self.queue_panel = Panel(background_color=BG_DEEP_PURPLE)
         main_layout.addWidget(self.queue_panel, 50)
         
         # Right Column - Currently Playing (25%) - #fec5bb
-        self.playing_panel = self._create_playing_panel()
+        self.playing_panel = Panel(background_color=BG_SIDEBAR)
         main_layout.addWidget(self.playing_panel, 25)
         
     def _on_folder_changed(self, folder_path: str) -> None:
         """Handle music folder selection."""
-        print(f"Music folder selected: {folder_path}")
+        logger.debug("Music folder selected: %s", folder_path)
         
     def _on_track_selected(self, track) -> None:
         """Handle track selection from library."""
-        print(f"Track selected: {track.title} by {track.artist}")
+        logger.debug("Track selected: %s by %s", track.title, track.artist)
         
     def _on_track_double_clicked(self, track) -> None:
         """Handle track double-click from library - add to queue and play."""
-        print(f"Track double-clicked: {track.title} - adding to queue")
+        logger.debug("Track double-clicked: %s - adding to queue", track.title)
         self.queue_manager.add_track(track)
         # If this is the first track, set it as current
         if self.queue_manager.size() == 1:
@@ -78,15 +133,13 @@ class HomeScreen(QWidget):
     def _on_album_add_requested(self, tracks: list) -> None:
         """Handle album addition from library."""
         if tracks:
-            print(f"Adding album with {len(tracks)} tracks to queue")
-            self.queue_manager.add_tracks(tracks)
-            # If this is the first content, set first track as current
-            if self.queue_manager.size() == len(tracks):
-                self.queue_manager.set_current_index(0)
+            logger.debug("Adding album with %d tracks to queue", len(tracks))
+            # If this is the first content, the first track becomes current
+            self.queue_manager.add_tracks(tracks, start_if_empty=True)
         
     def _create_queue_panel(self) -> Panel:
         """Create middle panel for queue."""
-        from ui.themes.colors import BG_DEEP_PURPLE
+        from ui.widgets.queue_widget import QueueWidget
         panel = Panel(background_color=BG_DEEP_PURPLE)
         
         # Queue widget (no header, starts immediately)
@@ -95,13 +148,12 @@ class HomeScreen(QWidget):
         panel.content_layout.setContentsMargins(0, 0, 0, 0)
         panel.content_layout.addWidget(self.queue_widget, 1)
         
-        # Update queue display when it changes
-        self.queue_manager.queue_changed.connect(self._update_queue_display)
-        
         return panel
         
     def _create_playing_panel(self) -> Panel:
         """Create right panel for currently playing track."""
+        from ui.widgets.now_playing_widget import NowPlayingWidget
+        from ui.widgets.playback_controls_widget import PlaybackControlsWidget
         panel = Panel(title="Currently Playing", background_color=BG_SIDEBAR, show_mini_player=True)
         
         # Connect mini player button
@@ -112,6 +164,8 @@ class HomeScreen(QWidget):
         self.now_playing_widget = NowPlayingWidget()
         self.now_playing_widget.seek_requested.connect(self._on_seek_requested)
         self.now_playing_widget.mini_player_requested.connect(self._on_open_mini_player)
+        # Bound once; _on_position_changed runs on every position tick
+        self._update_position = self.now_playing_widget.update_position
         panel.add_widget(self.now_playing_widget)
         
         panel.add_stretch()
@@ -125,14 +179,9 @@ class HomeScreen(QWidget):
         
         return panel
         
-    def _update_queue_display(self) -> None:
-        """Update queue display when it changes."""
-        # Queue widget handles its own display updates
-        pass
-        
     def _on_queue_track_double_clicked(self, index: int) -> None:
         """Handle double-click on queue track - play from that position."""
-        print(f"Playing from queue index: {index}")
+        logger.debug("Playing from queue index: %d", index)
         self.queue_manager.set_current_index(index)
         self._play_current_track()
         
@@ -141,13 +190,23 @@ class HomeScreen(QWidget):
         self.audio_engine.playback_started.connect(self._on_playback_started)
         self.audio_engine.playback_paused.connect(self._on_playback_paused)
         self.audio_engine.playback_resumed.connect(self._on_playback_resumed)
-        self.audio_engine.playback_finished.connect(self._on_playback_finished)
+        # playback_finished is only ever emitted from the playback thread; the other
+        # engine signals come from the GUI thread (position via a QTimer), so they
+        # keep the default connection and are delivered directly
+        self.audio_engine.playback_finished.connect(
+            self._on_playback_finished, Qt.QueuedConnection
+        )
         self.audio_engine.position_changed.connect(self._on_position_changed)
         self.audio_engine.duration_changed.connect(self._on_duration_changed)
         
         # Connect queue manager signals
         self.queue_manager.current_track_changed.connect(self._on_current_track_changed)
-        self.queue_manager.queue_changed.connect(self.save_queue)
+        # Persist queue edits in bursts rather than rewriting queue.json per change
+        self._queue_save_timer = QTimer(self)
+        self._queue_save_timer.setSingleShot(True)
+        self._queue_save_timer.setInterval(self.settings.SAVE_DELAY_MS)
+        self._queue_save_timer.timeout.connect(self.save_queue)
+        self.queue_manager.queue_changed.connect(self._queue_save_timer.start)
         
     def _play_current_track(self) -> None:
         """Play the current track from queue."""
@@ -160,35 +219,47 @@ class HomeScreen(QWidget):
         self.now_playing_widget.set_track(track)
         self.playback_controls.set_playing(True)
         self.playback_controls.set_enabled(True)
+        self._update_mini_player_track(track)
         
     def _on_playback_paused(self) -> None:
         """Handle playback pause."""
         self.playback_controls.set_playing(False)
         self.now_playing_widget.pause_visualizer()
+        if self._mini_player_shown():
+            self.mini_player.set_playing(False)
         
     def _on_playback_resumed(self) -> None:
         """Handle playback resume."""
         self.playback_controls.set_playing(True)
         self.now_playing_widget.resume_visualizer()
+        if self._mini_player_shown():
+            self.mini_player.set_playing(True)
         
     def _on_playback_finished(self) -> None:
         """Handle track finish - auto advance."""
-        print("Track finished, advancing to next...")
+        logger.debug("Track finished, advancing to next")
         if self.queue_manager.has_next():
             self.queue_manager.next_track()
             self._play_current_track()
         else:
-            print("End of queue reached")
+            logger.debug("End of queue reached")
             self.playback_controls.set_playing(False)
             self.now_playing_widget.stop_visualizer()
             
     def _on_position_changed(self, position: float) -> None:
-        """Handle playback position update."""
-        self.now_playing_widget.update_position(position)
+        """Handle playback position update for the Now Playing widget and mini player."""
+        # Nothing to repaint in a view that is hidden (or whose window is
+        # minimized); the next tick after it is shown brings it up to date
+        if self.now_playing_widget.isVisible() and not self.window().isMinimized():
+            self._update_position(position)
+        if self._mini_player_shown():
+            self.mini_player.update_position(position)
         
     def _on_duration_changed(self, duration: float) -> None:
         """Handle duration change."""
         self.now_playing_widget.set_duration(duration)
+        if self._mini_player_shown():
+            self.mini_player.set_duration(duration)
         
     def _on_current_track_changed(self, track) -> None:
         """Handle current track change from queue manager."""
@@ -217,12 +288,11 @@ class HomeScreen(QWidget):
         prev_track = self.audio_engine.get_previous_track()
         if prev_track:
             # Find track in queue and play it
-            queue = self.queue_manager.get_queue()
-            for idx, track in enumerate(queue):
-                if track.file_path == prev_track.file_path:
-                    self.queue_manager.set_current_index(idx)
-                    self._play_current_track()
-                    return
+            idx = self.queue_manager.index_of(prev_track.file_path)
+            if idx is not None:
+                self.queue_manager.set_current_index(idx)
+                self._play_current_track()
+                return
                     
         # Fallback to queue previous
         if self.queue_manager.has_previous():
@@ -236,6 +306,7 @@ class HomeScreen(QWidget):
     def _on_open_mini_player(self) -> None:
         """Open or show the mini player window."""
         if self.mini_player is None:
+            from ui.mini_player_window import MiniPlayerWindow
             # Create mini player window
             self.mini_player = MiniPlayerWindow()
             
@@ -244,83 +315,81 @@ class HomeScreen(QWidget):
             self.mini_player.next_clicked.connect(self._on_next)
             self.mini_player.previous_clicked.connect(self._on_previous)
             
-            # Connect audio signals to mini player
-            self.audio_engine.playback_started.connect(self._update_mini_player_track)
-            self.audio_engine.playback_paused.connect(self._on_mini_player_paused)
-            self.audio_engine.playback_resumed.connect(self._on_mini_player_resumed)
-            self.audio_engine.position_changed.connect(self._on_mini_player_position_changed)
-            self.audio_engine.duration_changed.connect(self._on_mini_player_duration_changed)
-            
-            # Update with current track if playing
-            current_track = self.queue_manager.get_current_track()
-            if current_track:
-                self._update_mini_player_track(current_track)
-                if self.audio_engine.is_playing():
-                    self.mini_player.set_playing(True)
-                else:
-                    self.mini_player.set_playing(False)
+            # Audio engine updates reach the mini player through the HomeScreen
+            # slots that already handle them, so no extra connections are made
             
+        if not self.mini_player.isVisible():
+            self._sync_mini_player()
         self.mini_player.show()
         self.mini_player.raise_()
         self.mini_player.activateWindow()
     
+    def _mini_player_shown(self) -> bool:
+        """Whether the mini player exists and is on screen to receive updates."""
+        return self.mini_player is not None and self.mini_player.isVisible()
+    
+    def _sync_mini_player(self) -> None:
+        """Catch the mini player up on updates skipped while it was hidden."""
+        current_track = self.queue_manager.get_current_track()
+        if current_track is None:
+            return
+        # Loading a track restarts the visualizer's analysis, so only do it on change
+        if current_track is not self.mini_player.current_track:
+            self.mini_player.update_track(current_track)
+            self.mini_player.set_track(current_track)
+            self.mini_player.set_duration(self.audio_engine.get_duration())
+        self.mini_player.set_playing(self.audio_engine.is_playing())
+    
     def _update_mini_player_track(self, track) -> None:
         """Update mini player with new track."""
-        if self.mini_player:
+        if self._mini_player_shown():
             self.mini_player.update_track(track)
             self.mini_player.set_track(track)
             self.mini_player.set_playing(True)
     
-    def _on_mini_player_paused(self) -> None:
-        """Handle playback pause for mini player."""
-        if self.mini_player:
-            self.mini_player.set_playing(False)
-    
-    def _on_mini_player_resumed(self) -> None:
-        """Handle playback resume for mini player."""
-        if self.mini_player:
-            self.mini_player.set_playing(True)
-    
-    def _on_mini_player_position_changed(self, position: float) -> None:
-        """Handle position change for mini player."""
-        if self.mini_player:
-            self.mini_player.update_position(position)
-    
-    def _on_mini_player_duration_changed(self, duration: float) -> None:
-        """Handle duration change for mini player."""
-        if self.mini_player:
-            self.mini_player.set_duration(duration)
-    
     def _restore_queue(self) -> None:
         """Restore queue from settings on startup."""
+        self._queue_restored = True
         try:
             saved_queue = self.settings.get_queue()
             saved_index = self.settings.get_current_queue_index()
             if saved_queue:
-                print(f"Restoring queue with {len(saved_queue)} tracks, index {saved_index}")
+                logger.info("Restoring queue with %d tracks, index %d", len(saved_queue), saved_index)
                 self.queue_manager.restore(saved_queue, saved_index)
         except Exception as e:
-            print(f"Could not restore queue: {e}")
+            logger.warning("Could not restore queue: %s", e)
     
-    def save_queue(self) -> None:
-        """Save queue to settings."""
+    def save_queue(self, blocking: bool = False) -> None:
+        """Save queue to settings; the file write happens on a worker thread."""
+        if not self._queue_restored:
+            # The saved queue was never restored, so don't overwrite it
+            return
+        self._queue_save_timer.stop()
         try:
             serialized_queue = self.queue_manager.serialize()
             current_index = self.queue_manager.get_current_index()
-            self.settings.set_queue(serialized_queue)
-            self.settings.set_current_queue_index(current_index)
-            print(f"Queue saved with {len(serialized_queue)} tracks, index {current_index}")
+            # Serialize here, where the queue is owned; only the disk write moves
+            self._io_pool.start(_SaveQueueTask(self.settings, serialized_queue, current_index))
+            if blocking:
+                self._io_pool.waitForDone()
+            logger.debug("Queue saved with %d tracks, index %d", len(serialized_queue), current_index)
         except Exception as e:
-            print(f"Could not save queue: {e}")
+            logger.warning("Could not save queue: %s", e)
             
     def _setup_media_controller(self) -> None:
         """Initialize and connect media controller for OS media keys."""
         try:
+            # The platform backend (WinRT / D-Bus bindings) is imported here
+            # rather than while the window is being built
+            from core.media_controller import create_media_controller
+            self.media_controller = create_media_controller()
+            self.media_controller.set_main_window(self.window())
+            
             # Register with OS (may fail initially on Windows, will retry on first use)
             if self.media_controller.register():
-                print("Media controller registered successfully")
+                logger.info("Media controller registered successfully")
             else:
-                print("Media controller registration deferred - will retry on first playback")
+                logger.info("Media controller registration deferred - will retry on first playback")
                 
             # Connect media key signals to playback methods
             self.media_controller.play_pause_requested.connect(self._on_play_pause)
@@ -333,41 +402,59 @@ class HomeScreen(QWidget):
             self.audio_engine.playback_paused.connect(self._on_media_playback_paused)
             self.audio_engine.playback_resumed.connect(self._on_media_playback_resumed)
             self.audio_engine.playback_stopped.connect(self._on_media_playback_stopped)
-            self.audio_engine.playback_finished.connect(self._on_media_playback_stopped)
+            self.audio_engine.playback_finished.connect(
+                self._on_media_playback_stopped, Qt.QueuedConnection
+            )
+            self.audio_engine.position_changed.connect(self.media_controller.update_position)
         except Exception as e:
-            print(f"Failed to setup media controller: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Failed to setup media controller: %s", e)
             
     def _on_media_stop(self) -> None:
         """Handle stop request from media keys."""
         self.audio_engine.stop()
         
+    def _safe_media(self, fn: Callable[[], None]) -> None:
+        """Run a media controller update, backing off for a while after one fails."""
+        if self._media_broken:
+            return
+        try:
+            fn()
+        except Exception as e:
+            logger.warning("Failed to update media controller: %s", e)
+            # Skip updates until the OS media session may be available again
+            self._media_broken = True
+            QTimer.singleShot(MEDIA_RETRY_MS, self, self._retry_media)
+            
+    def _retry_media(self) -> None:
+        """Allow media controller updates again and resend what was missed."""
+        self._media_broken = False
+        # Updates dropped during the back-off would otherwise leave the OS
+        # showing stale state until the next playback event
+        track = self.audio_engine.current_track or self.queue_manager.get_current_track()
+        
+        def update() -> None:
+            self.media_controller.update_track(track)
+            self.media_controller.update_state(
+                is_playing=self.audio_engine.is_playing(),
+                is_paused=self.audio_engine.is_paused()
+            )
+        self._safe_media(update)
+        
     def _on_media_playback_started(self, track) -> None:
         """Update media controller when playback starts."""
-        try:
+        def update() -> None:
             self.media_controller.update_track(track)
             self.media_controller.update_state(is_playing=True, is_paused=False)
-        except Exception as e:
-            print(f"Failed to update media controller on playback start: {e}")
+        self._safe_media(update)
             
     def _on_media_playback_paused(self) -> None:
         """Update media controller when playback pauses."""
-        try:
-            self.media_controller.update_state(is_playing=False, is_paused=True)
-        except Exception as e:
-            print(f"Failed to update media controller on pause: {e}")
+        self._safe_media(lambda: self.media_controller.update_state(is_playing=False, is_paused=True))
             
     def _on_media_playback_resumed(self) -> None:
         """Update media controller when playback resumes."""
-        try:
-            self.media_controller.update_state(is_playing=True, is_paused=False)
-        except Exception as e:
-            print(f"Failed to update media controller on resume: {e}")
+        self._safe_media(lambda: self.media_controller.update_state(is_playing=True, is_paused=False))
             
     def _on_media_playback_stopped(self) -> None:
         """Update media controller when playback stops."""
-        try:
-            self.media_controller.update_state(is_playing=False, is_paused=False)
-        except Exception as e:
-            print(f"Failed to update media controller on stop: {e}")
+        self._safe_media(lambda: self.media_controller.update_state(is_playing=False, is_paused=False))
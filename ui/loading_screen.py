@@ -3,19 +3,48 @@ Loading screen widget with progress indicator
 """
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QProgressBar
-from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtCore import Qt, QTimer, Signal, QPropertyAnimation
 from ui.themes.colors import ACCENT_LAVENDER, TEXT_PRIMARY, TEXT_SECONDARY, BG_PANEL
 from ui.themes import FontManager
 
+# Label, progress bar and background styled from one sheet parsed once
+_LOADING_QSS = f"""
+    LoadingScreen {{
+        background-color: {BG_PANEL};
+        border-radius: 12px;
+    }}
+    QLabel {{
+        color: {TEXT_SECONDARY};
+        background: transparent;
+    }}
+    QProgressBar {{
+        background-color: rgba(0, 0, 0, 0.08);
+        border-radius: 2px;
+        border: none;
+    }}
+    QProgressBar::chunk {{
+        background-color: {ACCENT_LAVENDER};
+        border-radius: 2px;
+    }}
+"""
+
 
 class LoadingScreen(QWidget):
     """Frameless loading screen with progress animation."""
     
     loading_complete = Signal()
     
+    LOAD_DURATION_MS = 1500
+    # (fraction of the animation, label) for each loading stage
+    STAGES = (
+        (0.0, "Loading existing queue..."),
+        (0.34, "Registering shortcuts..."),
+        (0.68, "Found audio files..."),
+        (0.92, "Ready!"),
+    )
+    
     def __init__(self) -> None:
         super().__init__()
-        self._progress = 0
         self._setup_ui()
         self._setup_timer()
         
@@ -33,7 +62,6 @@ class LoadingScreen(QWidget):
         self.loading_label = QLabel("Initializing...")
         self.loading_label.setAlignment(Qt.AlignCenter)
         self.loading_label.setFont(FontManager.get_body_font(11))
-        self.loading_label.setStyleSheet(f"color: {TEXT_SECONDARY}; background: transparent;")
         
         # Progress bar
         self.progress_bar = QProgressBar()
@@ -41,17 +69,6 @@ class LoadingScreen(QWidget):
         self.progress_bar.setValue(0)
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setFixedHeight(4)
-        self.progress_bar.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: rgba(0, 0, 0, 0.08);
-                border-radius: 2px;
-                border: none;
-            }}
-            QProgressBar::chunk {{
-                background-color: {ACCENT_LAVENDER};
-                border-radius: 2px;
-            }}
-        """)
         
         layout.addStretch()
         layout.addWidget(self.loading_label)
@@ -59,42 +76,28 @@ class LoadingScreen(QWidget):
         layout.addStretch()
         
         # Background styling
-        self.setStyleSheet(f"""
-            LoadingScreen {{
-                background-color: {BG_PANEL};
-                border-radius: 12px;
-            }}
-        """)
+        self.setStyleSheet(_LOADING_QSS)
         
     def _setup_timer(self) -> None:
-        """Setup progress simulation timer."""
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._update_progress)
+        """Setup the progress animation, which runs in Qt without Python callbacks."""
+        self._progress_anim = QPropertyAnimation(self.progress_bar, b"value", self)
+        self._progress_anim.setDuration(self.LOAD_DURATION_MS)
+        self._progress_anim.setStartValue(0)
+        self._progress_anim.setEndValue(100)
+        self._progress_anim.finished.connect(
+            lambda: QTimer.singleShot(300, self, self.loading_complete.emit)
+        )
         
     def start_loading(self) -> None:
         """Begin loading animation."""
-        self._progress = 0
         self.progress_bar.setValue(0)
-        self.timer.start(30)  # Update every 30ms
-        
-    def _update_progress(self) -> None:
-        """Update progress bar animation."""
-        self._progress += 2
-        
-        if self._progress <= 33:
-            self.loading_label.setText("Loading existing queue...")
-        elif self._progress <= 66:
-            self.loading_label.setText("Registering shortcuts...")
-        elif self._progress <= 90:
-            self.loading_label.setText("Found audio files...")
-        else:
-            self.loading_label.setText("Ready!")
-        
-        self.progress_bar.setValue(self._progress)
-        
-        if self._progress >= 100:
-            self.timer.stop()
-            QTimer.singleShot(300, self.loading_complete.emit)
+        self._progress_anim.start()
+        # Only the label text needs Python, once per stage
+        for fraction, text in self.STAGES:
+            QTimer.singleShot(
+                int(fraction * self.LOAD_DURATION_MS), self,
+                lambda text=text: self.loading_label.setText(text)
+            )
             
     def center_on_screen(self) -> None:
         """Center the loading screen on the primary display."""
@@ -2,11 +2,39 @@
 Main application window with frameless design
 """
 
+import logging
+from typing import Callable, Dict, Optional
 from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QStackedWidget
-from PySide6.QtCore import Qt, QPoint
+from PySide6.QtCore import Qt, QPoint, QTimer
 from ui.themes.colors import BG_PANEL, TEXT_PRIMARY, BORDER_LIGHT
 from ui.themes import FontManager
 
+logger = logging.getLogger(__name__)
+
+# One sheet for the whole title bar, parsed once instead of per child widget
+_TITLE_BAR_QSS = f"""
+    CustomTitleBar {{
+        background-color: {BG_PANEL};
+        border-bottom: 1px solid {BORDER_LIGHT};
+    }}
+    QLabel {{
+        color: {TEXT_PRIMARY};
+        background: transparent;
+    }}
+    QPushButton {{
+        background-color: transparent;
+        color: {TEXT_PRIMARY};
+        border: none;
+    }}
+    QPushButton:hover {{
+        background-color: rgba(0, 0, 0, 0.05);
+    }}
+    QPushButton#titleBarClose:hover {{
+        background-color: #e57373;
+        color: #ffffff;
+    }}
+"""
+
 
 class CustomTitleBar(QWidget):
     """Custom title bar for frameless window."""
@@ -14,7 +42,14 @@ class CustomTitleBar(QWidget):
     def __init__(self, parent: QMainWindow) -> None:
         super().__init__(parent)
         self.parent_window = parent
-        self._drag_pos = QPoint()
+        self._drag_pos: Optional[QPoint] = None  # Set only for manual (non-system) drags
+        self._pending_move: Optional[QPoint] = None
+        # Manual drags move the window at most once per event-loop pass
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setTimerType(Qt.PreciseTimer)
+        self._move_timer.setInterval(0)
+        self._move_timer.timeout.connect(self._apply_pending_move)
         self._setup_ui()
         
     def _setup_ui(self) -> None:
@@ -27,12 +62,12 @@ class CustomTitleBar(QWidget):
         # App title
         title = QLabel("Peachy Player")
         title.setFont(FontManager.get_body_font(11))
-        title.setStyleSheet(f"color: {TEXT_PRIMARY}; background: transparent;")
         
         # Window controls
         self.minimize_btn = QPushButton("−")
         self.maximize_btn = QPushButton("□")
         self.close_btn = QPushButton("×")
+        self.close_btn.setObjectName("titleBarClose")
         
         for btn in [self.minimize_btn, self.maximize_btn, self.close_btn]:
             btn.setFixedSize(40, 40)
@@ -43,40 +78,13 @@ class CustomTitleBar(QWidget):
         self.maximize_btn.clicked.connect(self._toggle_maximize)
         self.close_btn.clicked.connect(self.parent_window.close)
         
-        # Styling
-        button_style = f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {TEXT_PRIMARY};
-                border: none;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(0, 0, 0, 0.05);
-            }}
-        """
-        close_style = button_style + """
-            QPushButton:hover {
-                background-color: #e57373;
-                color: #ffffff;
-            }
-        """
-        
-        self.minimize_btn.setStyleSheet(button_style)
-        self.maximize_btn.setStyleSheet(button_style)
-        self.close_btn.setStyleSheet(close_style)
-        
         layout.addWidget(title)
         layout.addStretch()
         layout.addWidget(self.minimize_btn)
         layout.addWidget(self.maximize_btn)
         layout.addWidget(self.close_btn)
         
-        self.setStyleSheet(f"""
-            CustomTitleBar {{
-                background-color: {BG_PANEL};
-                border-bottom: 1px solid {BORDER_LIGHT};
-            }}
-        """)
+        self.setStyleSheet(_TITLE_BAR_QSS)
         
     def _toggle_maximize(self) -> None:
         """Toggle window maximize state."""
@@ -88,14 +96,29 @@ class CustomTitleBar(QWidget):
     def mousePressEvent(self, event) -> None:
         """Handle mouse press for window dragging."""
         if event.button() == Qt.LeftButton:
-            self._drag_pos = event.globalPosition().toPoint() - self.parent_window.frameGeometry().topLeft()
+            # Let the window manager move the window where supported, so drags
+            # don't run Python per mouse move (and work on Wayland at all)
+            handle = self.parent_window.windowHandle()
+            if not self.parent_window.isMaximized() and handle and handle.startSystemMove():
+                self._drag_pos = None
+            else:
+                self._drag_pos = event.globalPosition().toPoint() - self.parent_window.frameGeometry().topLeft()
             event.accept()
             
     def mouseMoveEvent(self, event) -> None:
-        """Handle mouse move for window dragging."""
-        if event.buttons() == Qt.LeftButton and not self.parent_window.isMaximized():
-            self.parent_window.move(event.globalPosition().toPoint() - self._drag_pos)
+        """Handle mouse move for window dragging when the system move is unavailable."""
+        if (event.buttons() == Qt.LeftButton and self._drag_pos is not None
+                and not self.parent_window.isMaximized()):
+            self._pending_move = event.globalPosition().toPoint()
+            if not self._move_timer.isActive():
+                self._move_timer.start()
             event.accept()
+            
+    def _apply_pending_move(self) -> None:
+        """Move the window to the latest drag position."""
+        if self._pending_move is not None and self._drag_pos is not None:
+            self.parent_window.move(self._pending_move - self._drag_pos)
+        self._pending_move = None
 
 
 class MainWindow(QMainWindow):
@@ -116,8 +139,9 @@ class MainWindow(QMainWindow):
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.setAttribute(Qt.WA_TranslucentBackground, False)
         
-        # Will be set when media controller is initialized
-        self._media_controller = None
+        # Screens built on first show: key -> factory, and key -> stack page
+        self._screen_factories: Dict[str, Callable[[], QWidget]] = {}
+        self._screens: Dict[str, QWidget] = {}
         
     def _setup_ui(self) -> None:
         """Initialize UI components."""
@@ -146,8 +170,26 @@ class MainWindow(QMainWindow):
         # Main window styling - keep minimal to not override panel colors
         central.setStyleSheet(f"background-color: {BG_PANEL};")
         
-        # Store reference to media controller for nativeEvent handling
-        self._media_controller = self.home_screen.media_controller
+    def register_lazy_screen(self, key: str, factory: Callable[[], QWidget]) -> None:
+        """Reserve a page in the content stack that is built the first time it is shown."""
+        placeholder = QWidget()
+        self._screen_factories[key] = factory
+        self._screens[key] = placeholder
+        self.content_stack.addWidget(placeholder)
+        
+    def show_screen(self, key: str) -> QWidget:
+        """Switch to a registered screen, building it on first use."""
+        factory = self._screen_factories.pop(key, None)
+        if factory is not None:
+            placeholder = self._screens[key]
+            screen = factory()
+            self.content_stack.insertWidget(self.content_stack.indexOf(placeholder), screen)
+            self.content_stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self._screens[key] = screen
+        screen = self._screens[key]
+        self.content_stack.setCurrentWidget(screen)
+        return screen
         
     def center_on_screen(self) -> None:
         """Center the main window on the primary display."""
@@ -161,15 +203,16 @@ class MainWindow(QMainWindow):
         """Handle native Windows events for media key support."""
         try:
             # Check if we have a media controller and it's Windows-based
-            if self._media_controller and hasattr(self._media_controller, 'handle_windows_message'):
+            controller = self.home_screen.media_controller
+            if controller and hasattr(controller, 'handle_windows_message'):
                 # On Windows, eventType is b'windows_generic_MSG' or similar
                 if eventType == b'windows_generic_MSG' or b'windows' in eventType.lower():
-                    import ctypes
+                    import ctypes.wintypes
                     # Parse Windows message
                     msg = ctypes.wintypes.MSG.from_address(int(message))
                     
                     # Let the controller handle it
-                    if self._media_controller.handle_windows_message(msg.message, msg.wParam, msg.lParam):
+                    if controller.handle_windows_message(msg.message, msg.wParam, msg.lParam):
                         # Message was handled, return True to prevent further processing
                         return True, 0
         except Exception as e:
@@ -183,9 +226,11 @@ class MainWindow(QMainWindow):
         """Handle window close event - save queue and cleanup."""
         try:
             # Save the current queue state
-            self.home_screen.save_queue()
-            # Cleanup media controller
-            self.home_screen.media_controller.cleanup()
+            self.home_screen.save_queue(blocking=True)
+            self.home_screen.settings.flush()
+            # Cleanup media controller (not created if closed during startup)
+            if self.home_screen.media_controller is not None:
+                self.home_screen.media_controller.cleanup()
         except Exception as e:
-            print(f"Error during cleanup on close: {e}")
+            logger.warning("Error during cleanup on close: %s", e)
         event.accept()
@@ -2,16 +2,78 @@
 Mini Player Window - Compact player with visualizer and controls
 """
 
+import logging
 from typing import Optional
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                                QPushButton, QFrame)
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPixmap, QImage
-from ui.themes.colors import TEXT_PRIMARY, TEXT_SECONDARY, ACCENT_HOVER, BG_MID_PURPLE, ACCENT_LAVENDER
+from PySide6.QtCore import Qt, Signal, QSize
+from ui.themes.colors import TEXT_PRIMARY, TEXT_SECONDARY, ACCENT_HOVER, BG_MID_PURPLE
 from ui.themes import FontManager
 from core.audio_scanner import AudioTrack
 from ui.widgets.audio_visualizer_widget import AudioVisualizerWidget
 from utils.icon_manager import IconManager
+from utils.album_art import AlbumArtThumbnails
+
+logger = logging.getLogger(__name__)
+
+# Icon sizes as a share of the fixed button sizes (60% of 40px, 65% of 48px)
+_SKIP_ICON_SIZE = QSize(24, 24)
+_PLAY_ICON_SIZE = QSize(31, 31)
+
+# One sheet for the whole window, formatted and parsed once; children are
+# matched by object name so the visualizer is left unstyled
+_MINI_WINDOW_QSS = f"""
+    MiniPlayerWindow {{
+        background-color: {BG_MID_PURPLE};
+    }}
+    QFrame#miniDivider {{
+        background-color: rgba(0, 0, 0, 0.1);
+        max-height: 1px;
+    }}
+    QFrame#miniControlStrip {{
+        background-color: rgba(0, 0, 0, 0.03);
+    }}
+    QLabel#miniAlbumArt {{
+        background-color: rgba(0, 0, 0, 0.1);
+        border-radius: 6px;
+        border: 2px solid rgba(0, 0, 0, 0.1);
+    }}
+    QLabel#miniTitle {{
+        color: {TEXT_PRIMARY};
+        background: transparent;
+        font-weight: bold;
+    }}
+    QLabel#miniArtist, QLabel#miniAlbum {{
+        color: {TEXT_SECONDARY};
+        background: transparent;
+    }}
+    QPushButton#miniSkipButton {{
+        background-color: rgba(0, 0, 0, 0.1);
+        color: {TEXT_PRIMARY};
+        border: none;
+        border-radius: 20px;
+        font-size: 16px;
+    }}
+    QPushButton#miniSkipButton:hover {{
+        background-color: {ACCENT_HOVER};
+    }}
+    QPushButton#miniSkipButton:pressed {{
+        background-color: rgba(0, 0, 0, 0.2);
+    }}
+    QPushButton#miniPlayButton {{
+        background-color: transparent;
+        color: {TEXT_PRIMARY};
+        border: none;
+        border-radius: 24px;
+        font-size: 18px;
+    }}
+    QPushButton#miniPlayButton:hover {{
+        background-color: rgba(183, 148, 246, 0.2);
+    }}
+    QPushButton#miniPlayButton:pressed {{
+        background-color: rgba(183, 148, 246, 0.3);
+    }}
+"""
 
 
 class MiniPlayerWindow(QWidget):
@@ -25,6 +87,8 @@ class MiniPlayerWindow(QWidget):
         super().__init__(parent)
         self.current_track: Optional[AudioTrack] = None
         self.is_playing = False
+        # The last couple of tracks, enough to skip back and forth without re-decoding
+        self._album_art = AlbumArtThumbnails(75, max_entries=2)
         self._setup_window()
         self._setup_ui()
         
@@ -43,11 +107,7 @@ class MiniPlayerWindow(QWidget):
         )
         
         self.setAttribute(Qt.WA_StyledBackground, True)
-        self.setStyleSheet(f"""
-            MiniPlayerWindow {{
-                background-color: {BG_MID_PURPLE};
-            }}
-        """)
+        self.setStyleSheet(_MINI_WINDOW_QSS)
         
     def _setup_ui(self) -> None:
         """Initialize UI components."""
@@ -63,14 +123,14 @@ class MiniPlayerWindow(QWidget):
         # Divider
         divider = QFrame()
         divider.setFrameShape(QFrame.HLine)
-        divider.setStyleSheet("background-color: rgba(0, 0, 0, 0.1); max-height: 1px;")
+        divider.setObjectName("miniDivider")
         main_layout.addWidget(divider)
         
         # Info and Controls Strip (bottom section - fixed height)
         control_strip = QFrame()
         control_strip.setFixedHeight(100)
         control_strip.setAttribute(Qt.WA_StyledBackground, True)
-        control_strip.setStyleSheet("background-color: rgba(0, 0, 0, 0.03);")
+        control_strip.setObjectName("miniControlStrip")
         
         strip_layout = QHBoxLayout(control_strip)
         strip_layout.setContentsMargins(16, 12, 16, 12)
@@ -80,13 +140,9 @@ class MiniPlayerWindow(QWidget):
         self.album_art_label = QLabel()
         self.album_art_label.setFixedSize(75, 75)
         self.album_art_label.setAlignment(Qt.AlignCenter)
-        self.album_art_label.setStyleSheet("""
-            QLabel {
-                background-color: rgba(0, 0, 0, 0.1);
-                border-radius: 6px;
-                border: 2px solid rgba(0, 0, 0, 0.1);
-            }
-        """)
+        # Font for the placeholder note, set once rather than per track change
+        self.album_art_label.setFont(FontManager.get_display_font(28))
+        self.album_art_label.setObjectName("miniAlbumArt")
         strip_layout.addWidget(self.album_art_label)
         
         # Track Info (flexible width)
@@ -96,17 +152,17 @@ class MiniPlayerWindow(QWidget):
         
         self.title_label = QLabel("No track playing")
         self.title_label.setFont(FontManager.get_body_font(12))
-        self.title_label.setStyleSheet(f"color: {TEXT_PRIMARY}; background: transparent; font-weight: bold;")
+        self.title_label.setObjectName("miniTitle")
         self.title_label.setWordWrap(False)
         
         self.artist_label = QLabel("")
         self.artist_label.setFont(FontManager.get_small_font(10))
-        self.artist_label.setStyleSheet(f"color: {TEXT_SECONDARY}; background: transparent;")
+        self.artist_label.setObjectName("miniArtist")
         self.artist_label.setWordWrap(False)
         
         self.album_label = QLabel("")
         self.album_label.setFont(FontManager.get_small_font(9))
-        self.album_label.setStyleSheet(f"color: {TEXT_SECONDARY}; background: transparent;")
+        self.album_label.setObjectName("miniAlbum")
         self.album_label.setWordWrap(False)
         
         info_layout.addWidget(self.title_label)
@@ -120,45 +176,13 @@ class MiniPlayerWindow(QWidget):
         controls_layout.setSpacing(8)
         controls_layout.setAlignment(Qt.AlignVCenter)
         
-        button_style = f"""
-            QPushButton {{
-                background-color: rgba(0, 0, 0, 0.1);
-                color: {TEXT_PRIMARY};
-                border: none;
-                border-radius: 20px;
-                font-size: 16px;
-            }}
-            QPushButton:hover {{
-                background-color: {ACCENT_HOVER};
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(0, 0, 0, 0.2);
-            }}
-        """
-        
-        large_button_style = f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {TEXT_PRIMARY};
-                border: none;
-                border-radius: 24px;
-                font-size: 18px;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(183, 148, 246, 0.2);
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(183, 148, 246, 0.3);
-            }}
-        """
-        
         # Previous button
         self.prev_btn = QPushButton()
         self.prev_btn.setIcon(IconManager.get_icon("track-prev"))
         self.prev_btn.setFixedSize(40, 40)
-        self.prev_btn.setIconSize(self.prev_btn.size() * 0.6)
+        self.prev_btn.setIconSize(_SKIP_ICON_SIZE)
         self.prev_btn.setCursor(Qt.PointingHandCursor)
-        self.prev_btn.setStyleSheet(button_style)
+        self.prev_btn.setObjectName("miniSkipButton")
         self.prev_btn.setToolTip("Previous track")
         self.prev_btn.clicked.connect(self.previous_clicked.emit)
         
@@ -166,9 +190,9 @@ class MiniPlayerWindow(QWidget):
         self.play_pause_btn = QPushButton()
         self.play_pause_btn.setIcon(IconManager.get_icon("play"))
         self.play_pause_btn.setFixedSize(48, 48)
-        self.play_pause_btn.setIconSize(self.play_pause_btn.size() * 0.65)
+        self.play_pause_btn.setIconSize(_PLAY_ICON_SIZE)
         self.play_pause_btn.setCursor(Qt.PointingHandCursor)
-        self.play_pause_btn.setStyleSheet(large_button_style)
+        self.play_pause_btn.setObjectName("miniPlayButton")
         self.play_pause_btn.setToolTip("Play")
         self.play_pause_btn.clicked.connect(self.play_pause_clicked.emit)
         
@@ -176,9 +200,9 @@ class MiniPlayerWindow(QWidget):
         self.next_btn = QPushButton()
         self.next_btn.setIcon(IconManager.get_icon("track-next"))
         self.next_btn.setFixedSize(40, 40)
-        self.next_btn.setIconSize(self.next_btn.size() * 0.6)
+        self.next_btn.setIconSize(_SKIP_ICON_SIZE)
         self.next_btn.setCursor(Qt.PointingHandCursor)
-        self.next_btn.setStyleSheet(button_style)
+        self.next_btn.setObjectName("miniSkipButton")
         self.next_btn.setToolTip("Next track")
         self.next_btn.clicked.connect(self.next_clicked.emit)
         
@@ -203,17 +227,9 @@ class MiniPlayerWindow(QWidget):
             self.album_label.setText(album_text)
             
             # Update album art
-            if track.album_art_data:
-                pixmap = self._load_album_art(track.album_art_data)
-                if pixmap:
-                    scaled_pixmap = pixmap.scaled(
-                        75, 75,
-                        Qt.KeepAspectRatio,
-                        Qt.SmoothTransformation
-                    )
-                    self.album_art_label.setPixmap(scaled_pixmap)
-                else:
-                    self._set_placeholder_art()
+            pixmap = self._album_art.get(track)
+            if pixmap is not None:
+                self.album_art_label.setPixmap(pixmap)
             else:
                 self._set_placeholder_art()
         else:
@@ -222,33 +238,22 @@ class MiniPlayerWindow(QWidget):
             self.album_label.setText("")
             self._set_placeholder_art()
             
-    def _load_album_art(self, image_data: bytes) -> Optional[QPixmap]:
-        """Convert image bytes to QPixmap."""
-        try:
-            image = QImage()
-            if image.loadFromData(image_data):
-                return QPixmap.fromImage(image)
-        except Exception as e:
-            print(f"Error loading album art: {e}")
-        return None
-        
     def _set_placeholder_art(self) -> None:
         """Set placeholder album art."""
-        self.album_art_label.clear()
+        # setText replaces any pixmap and is a no-op if the note is already shown
         self.album_art_label.setText("♪")
-        self.album_art_label.setFont(FontManager.get_display_font(28))
-        self.album_art_label.setAlignment(Qt.AlignCenter)
         
     def set_playing(self, playing: bool) -> None:
         """Update play/pause button state."""
-        self.is_playing = playing
+        # The button only changes when the state does; the visualizer is
+        # always synced since set_track() restarts it
+        if playing != self.is_playing:
+            self.is_playing = playing
+            self.play_pause_btn.setIcon(IconManager.get_icon("pause" if playing else "play"))
+            self.play_pause_btn.setToolTip("Pause" if playing else "Play")
         if playing:
-            self.play_pause_btn.setIcon(IconManager.get_icon("pause"))
-            self.play_pause_btn.setToolTip("Pause")
             self.visualizer.resume()
         else:
-            self.play_pause_btn.setIcon(IconManager.get_icon("play"))
-            self.play_pause_btn.setToolTip("Play")
             self.visualizer.pause()
             
     def update_position(self, position: float) -> None:
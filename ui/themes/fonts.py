@@ -3,27 +3,21 @@ Font management for the application
 Handles loading and caching of custom fonts
 """
 
+import logging
 from PySide6.QtGui import QFontDatabase, QFont
 from PySide6.QtCore import QFile
+import functools
 import os
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 
 class FontManager:
     """Manages custom font loading and provides font instances."""
     
-    _instance = None
     _fonts_loaded = False
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(FontManager, cls).__new__(cls)
-        return cls._instance
-    
-    def __init__(self):
-        # Don't load fonts immediately - wait for explicit call
-        pass
-    
     def load_fonts(self) -> None:
         """Load custom fonts from assets directory. Must be called after QApplication init."""
         if FontManager._fonts_loaded:
@@ -36,9 +30,12 @@ class FontManager:
                 font_id = QFontDatabase.addApplicationFont(str(font_file))
                 if font_id != -1:
                     families = QFontDatabase.applicationFontFamilies(font_id)
-                    print(f"Loaded font: {families}")
+                    logger.debug("Loaded font: %s", families)
         
         FontManager._fonts_loaded = True
+        # Fonts resolved before loading may have fallen back; match them again
+        FontManager._resolve_family.cache_clear()
+        FontManager._match_font.cache_clear()
     
     @staticmethod
     def get_font(size: int = 12, weight: QFont.Weight = QFont.Normal) -> QFont:
@@ -46,17 +43,24 @@ class FontManager:
         Get Jersey 25 font with specified size and weight.
         Falls back to system default if Jersey 25 is unavailable.
         """
-        font = QFont("Jersey 25", size, weight)
-        
+        # Callers get their own copy; QFont is implicitly shared so this is cheap
+        return QFont(FontManager._match_font(size, weight))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _match_font(size: int, weight: QFont.Weight) -> QFont:
+        """Build the font once per size and weight."""
+        return QFont(FontManager._resolve_family(), size, weight)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _resolve_family() -> str:
+        """Pick Jersey 25 or the first available fallback, once for all sizes."""
         # Check if Jersey 25 is available, otherwise try fallbacks
-        if font.family() != "Jersey 25":
-            # Try common fallbacks
-            for fallback in ["Jersey 25 Charted", "Impact", "Arial Black", "Arial"]:
-                font = QFont(fallback, size, weight)
-                if font.family() == fallback:
-                    break
-        
-        return font
+        for family in ["Jersey 25", "Jersey 25 Charted", "Impact", "Arial Black"]:
+            if QFont(family).family() == family:
+                return family
+        return "Arial"
     
     @staticmethod
     def get_display_font(size: int = 24) -> QFont:
@@ -79,5 +83,5 @@ class FontManager:
         return FontManager.get_font(size, QFont.Normal)
 
 
-# Singleton instance (lazy initialization)
+# Shared instance; fonts are loaded by an explicit load_fonts() call
 font_manager = FontManager()
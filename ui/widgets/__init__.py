@@ -5,6 +5,13 @@ Reusable UI widget components
 from ui.widgets.panel import Panel
 from ui.widgets.section_header import SectionHeader
 from ui.widgets.placeholder_content import PlaceholderContent
-from ui.widgets.audio_visualizer_widget import AudioVisualizerWidget
 
 __all__ = ["Panel", "SectionHeader", "PlaceholderContent", "AudioVisualizerWidget"]
+
+
+def __getattr__(name: str):
+    """Import the visualizer (numpy, soundfile) only when it is first used."""
+    if name == "AudioVisualizerWidget":
+        from ui.widgets.audio_visualizer_widget import AudioVisualizerWidget
+        return AudioVisualizerWidget
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,7 @@
 Audio visualizer widget for real-time waveform visualization
 """
 
+import logging
 from typing import Optional
 import numpy as np
 from PySide6.QtWidgets import QWidget
@@ -10,6 +11,8 @@ from PySide6.QtGui import QPainter, QLinearGradient, QColor, QPen, QPainterPath
 import soundfile as sf
 from core.audio_scanner import AudioTrack
 
+logger = logging.getLogger(__name__)
+
 
 class AudioAnalysisWorker(QThread):
     """Worker thread for audio analysis to prevent UI blocking."""
@@ -50,7 +53,7 @@ class AudioAnalysisWorker(QThread):
             self.analysis_ready.emit(y, float(sr))
             
         except Exception as e:
-            print(f"Audio analysis error: {e}")
+            logger.warning("Audio analysis error: %s", e)
             
     def stop(self) -> None:
         """Stop the worker."""
@@ -211,7 +214,7 @@ class AudioVisualizerWidget(QWidget):
                                    (1 - self.smoothing) * new_points)
                         
         except Exception as e:
-            print(f"Visualization update error: {e}")
+            logger.warning("Visualization update error: %s", e)
             
         self.update()
         
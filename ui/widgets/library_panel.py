@@ -2,6 +2,7 @@
 Library panel widget with folder selection
 """
 
+import logging
 from typing import Optional
 from pathlib import Path
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFileDialog
@@ -13,10 +14,13 @@ from ui.themes.colors import (TEXT_PRIMARY, TEXT_SECONDARY, TEXT_MUTED,
 from ui.themes.fonts import FontManager
 from ui.widgets import PlaceholderContent
 from ui.widgets.track_list import TrackListWidget
-from core.settings import Settings
+from core.settings import get_settings
 from core.audio_scanner import AudioScanner, AudioTrack
+from core.library_cache import LibraryCache
 from utils import load_icon
 
+logger = logging.getLogger(__name__)
+
 
 class ScannerThread(QThread):
     """Background thread for scanning audio files."""
@@ -29,7 +33,7 @@ class ScannerThread(QThread):
         
     def run(self) -> None:
         """Scan directory for audio files."""
-        scanner = AudioScanner()
+        scanner = AudioScanner(cache=LibraryCache())
         tracks = scanner.scan_directory(self.folder_path)
         self.scan_complete.emit(tracks)
 
@@ -45,7 +49,7 @@ class LibraryPanel(QWidget):
     def __init__(self, parent: QWidget = None) -> None:
         super().__init__(parent)
         self.setAttribute(Qt.WA_StyledBackground, True)
-        self.settings = Settings()
+        self.settings = get_settings()
         self.scanner_thread: Optional[ScannerThread] = None
         self._setup_ui()
         self._load_saved_folder()
@@ -219,9 +223,9 @@ class LibraryPanel(QWidget):
         self.track_list.set_tracks(tracks)
         
         if tracks:
-            print(f"Found {len(tracks)} audio files")
+            logger.info("Found %d audio files", len(tracks))
         else:
-            print("No audio files found in selected folder")
+            logger.info("No audio files found in selected folder")
         
     def get_music_folder(self) -> Optional[str]:
         """Get the currently selected music folder."""
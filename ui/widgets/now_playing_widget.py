@@ -2,6 +2,7 @@
 Now Playing widget - displays current track information
 """
 
+import logging
 from typing import Optional
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSlider, QFrame, QPushButton
 from PySide6.QtCore import Qt, Signal
@@ -11,6 +12,8 @@ from ui.themes.fonts import FontManager
 from core.audio_scanner import AudioTrack
 from ui.widgets.audio_visualizer_widget import AudioVisualizerWidget
 
+logger = logging.getLogger(__name__)
+
 
 class NowPlayingWidget(QWidget):
     """Widget displaying currently playing track with album art and progress."""
@@ -22,6 +25,7 @@ class NowPlayingWidget(QWidget):
         super().__init__(parent)
         self.current_track: Optional[AudioTrack] = None
         self.duration = 0.0
+        self._shown_second = 0  # Whole second shown in current_time_label
         self.setAttribute(Qt.WA_StyledBackground, True)
         self._setup_ui()
         
@@ -153,8 +157,9 @@ class NowPlayingWidget(QWidget):
         self.artist_label.setText(artist_album)
         
         # Update album art
-        if track.album_art_data:
-            self._load_album_art(track.album_art_data)
+        album_art_data = track.get_album_art()
+        if album_art_data:
+            self._load_album_art(album_art_data)
         else:
             self._show_default_art()
             
@@ -170,7 +175,11 @@ class NowPlayingWidget(QWidget):
         
     def update_position(self, position: float) -> None:
         """Update playback position."""
-        self.current_time_label.setText(self._format_time(position))
+        # Position ticks several times a second; the label only changes once
+        second = int(position)
+        if second != self._shown_second:
+            self._shown_second = second
+            self.current_time_label.setText(self._format_time(position))
         
         # Update slider if not being dragged
         if not self.progress_slider.isSliderDown():
@@ -191,7 +200,7 @@ class NowPlayingWidget(QWidget):
                 scaled = pixmap.scaled(250, 250, Qt.KeepAspectRatio, Qt.SmoothTransformation)
                 self.album_art_label.setPixmap(scaled)
         except Exception as e:
-            print(f"Error loading album art: {e}")
+            logger.warning("Error loading album art: %s", e)
             self._show_default_art()
             
     def _show_default_art(self) -> None:
@@ -213,6 +222,7 @@ class NowPlayingWidget(QWidget):
         self.title_label.setText("No track playing")
         self.artist_label.setText("")
         self.current_time_label.setText("0:00")
+        self._shown_second = 0
         self.total_time_label.setText("0:00")
         self.progress_slider.setValue(0)
         
@@ -2,16 +2,69 @@
 Queue widget with drag-and-drop and album grouping
 """
 
-from typing import List, Dict, Optional
+import logging
+from itertools import islice
+from typing import List, Dict, Optional, Iterator, Tuple
 from pathlib import Path
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                                QScrollArea, QFrame, QPushButton)
-from PySide6.QtCore import Qt, Signal, QMimeData, QPoint, QSize, QByteArray
+from PySide6.QtCore import Qt, Signal, QMimeData, QPoint, QSize, QByteArray, QTimer
 from PySide6.QtGui import QDrag, QPixmap, QPainter, QColor, QImage
 from ui.themes.colors import TEXT_PRIMARY, TEXT_SECONDARY, TEXT_MUTED, ACCENT_HOVER, ACCENT_LAVENDER
 from ui.themes.fonts import FontManager
 from core.audio_scanner import AudioTrack
 from core.queue_manager import QueueManager
+from utils import AlbumArtThumbnails
+
+logger = logging.getLogger(__name__)
+
+# Queue rows are rebuilt on every refresh, so their styling lives in one sheet
+# parsed once on the QueueWidget and cascading to each row by object name
+# rather than in several per-widget sheets parsed for every row
+_TRACK_ROW_QSS = f"""
+    QueueTrackWidget {{
+        background-color: transparent;
+        border-radius: 0px;
+        border-left: 3px solid transparent;
+    }}
+    QueueTrackWidget:hover {{
+        background-color: rgba(183, 148, 246, 0.15);
+    }}
+    QueueTrackWidget[current="true"] {{
+        background-color: {ACCENT_LAVENDER};
+        border-left: 3px solid {ACCENT_LAVENDER};
+    }}
+    QLabel#queueTrackArt {{
+        border-radius: 4px;
+    }}
+    QLabel#queueTrackArtPlaceholder {{
+        background-color: rgba(183, 148, 246, 0.2);
+        border-radius: 4px;
+        color: {TEXT_SECONDARY};
+    }}
+    QLabel#queueTrackTitle {{
+        color: {TEXT_PRIMARY};
+        background: transparent;
+        font-weight: 400;
+    }}
+    QueueTrackWidget[current="true"] QLabel#queueTrackTitle {{
+        font-weight: 700;
+    }}
+    QLabel#queueTrackArtist {{
+        color: {TEXT_SECONDARY};
+        background: transparent;
+    }}
+    QPushButton#queueTrackRemove {{
+        background-color: rgba(183, 148, 246, 0.2);
+        color: {TEXT_SECONDARY};
+        border: none;
+        border-radius: 12px;
+    }}
+    QPushButton#queueTrackRemove:hover {{
+        background-color: #ff6b9d;
+        color: white;
+    }}
+"""
 
 
 class QueueTrackWidget(QFrame):
@@ -21,14 +74,18 @@ class QueueTrackWidget(QFrame):
     remove_requested = Signal(int)  # Emits queue index
     drag_started = Signal(int)  # Emits queue index
     
-    def __init__(self, track: AudioTrack, index: int, is_current: bool = False, read_only: bool = False, parent: QWidget = None) -> None:
+    def __init__(self, track: AudioTrack, index: int, is_current: bool = False, read_only: bool = False,
+                 thumbnail: Optional[QPixmap] = None, parent: QWidget = None) -> None:
         super().__init__(parent)
         self.track = track
+        self.thumbnail = thumbnail
         self.index = index
         self.is_current = is_current
         self.read_only = read_only
         self._drag_start_pos = QPoint()
         self.setAttribute(Qt.WA_StyledBackground, True)
+        # Selects the highlighted row rules in _TRACK_ROW_QSS
+        self.setProperty("current", is_current)
         self._setup_ui()
         
     def _setup_ui(self) -> None:
@@ -43,40 +100,14 @@ class QueueTrackWidget(QFrame):
         album_art_label.setScaledContents(False)
         album_art_label.setAlignment(Qt.AlignCenter)
         
-        # Try to load album art from track
-        art_loaded = False
-        if hasattr(self.track, 'album_art_data') and self.track.album_art_data:
-            pixmap = QPixmap()
-            if pixmap.loadFromData(self.track.album_art_data):
-                # Scale to fit while maintaining aspect ratio
-                scaled_pixmap = pixmap.scaled(
-                    40, 40,
-                    Qt.KeepAspectRatioByExpanding,
-                    Qt.SmoothTransformation
-                )
-                # Crop to square if needed
-                if scaled_pixmap.width() > 40 or scaled_pixmap.height() > 40:
-                    x = (scaled_pixmap.width() - 40) // 2
-                    y = (scaled_pixmap.height() - 40) // 2
-                    scaled_pixmap = scaled_pixmap.copy(x, y, 40, 40)
-                album_art_label.setPixmap(scaled_pixmap)
-                album_art_label.setStyleSheet("""
-                    QLabel {
-                        border-radius: 4px;
-                    }
-                """)
-                art_loaded = True
-        
-        if not art_loaded:
+        # Album art thumbnail from the queue's cache, or a placeholder
+        if self.thumbnail is not None:
+            album_art_label.setPixmap(self.thumbnail)
+            album_art_label.setObjectName("queueTrackArt")
+        else:
             album_art_label.setText("♪")
             album_art_label.setFont(FontManager.get_title_font(16))
-            album_art_label.setStyleSheet(f"""
-                QLabel {{
-                    background-color: rgba(183, 148, 246, 0.2);
-                    border-radius: 4px;
-                    color: {TEXT_SECONDARY};
-                }}
-            """)
+            album_art_label.setObjectName("queueTrackArtPlaceholder")
         
         layout.addWidget(album_art_label)
         
@@ -87,13 +118,13 @@ class QueueTrackWidget(QFrame):
         # Title
         title = QLabel(self.track.title)
         title.setFont(FontManager.get_body_font(10) if not self.is_current else FontManager.get_title_font(10))
-        title.setStyleSheet(f"color: {TEXT_PRIMARY}; background: transparent; font-weight: {'700' if self.is_current else '400'};")
+        title.setObjectName("queueTrackTitle")
         title.setWordWrap(True)
         
         # Artist
         artist = QLabel(self.track.artist)
         artist.setFont(FontManager.get_small_font(9))
-        artist.setStyleSheet(f"color: {TEXT_SECONDARY}; background: transparent;")
+        artist.setObjectName("queueTrackArtist")
         artist.setWordWrap(True)
         
         info_layout.addWidget(title)
@@ -107,36 +138,10 @@ class QueueTrackWidget(QFrame):
             remove_btn.setFixedSize(24, 24)
             remove_btn.setFont(FontManager.get_display_font(14))
             remove_btn.setCursor(Qt.PointingHandCursor)
-            remove_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: rgba(183, 148, 246, 0.2);
-                    color: {TEXT_SECONDARY};
-                    border: none;
-                    border-radius: 12px;
-                }}
-                QPushButton:hover {{
-                    background-color: #ff6b9d;
-                    color: white;
-                }}
-            """)
+            remove_btn.setObjectName("queueTrackRemove")
             remove_btn.clicked.connect(lambda: self.remove_requested.emit(self.index))
             layout.addWidget(remove_btn)
         
-        # Styling
-        # Use deep purple background for non-current tracks, lavender for current
-        bg_color = f"{ACCENT_LAVENDER}" if self.is_current else "transparent"
-        hover_color = "rgba(183, 148, 246, 0.15)" if not self.is_current else ACCENT_LAVENDER
-        
-        self.setStyleSheet(f"""
-            QueueTrackWidget {{
-                background-color: {bg_color};
-                border-radius: 0px;
-                border-left: 3px solid {ACCENT_LAVENDER if self.is_current else "transparent"};
-            }}
-            QueueTrackWidget:hover {{
-                background-color: {hover_color};
-            }}
-        """)
         if not self.read_only:
             self.setCursor(Qt.PointingHandCursor)
         
@@ -283,11 +288,18 @@ class QueueWidget(QWidget):
     """Queue display widget with flat track list and drag-and-drop."""
     
     track_double_clicked = Signal(int)  # Emits queue index to play
+    ROW_BATCH = 50  # Rows created per section at a time; more follow on scroll
     
     def __init__(self, queue_manager: QueueManager, parent: QWidget = None) -> None:
         super().__init__(parent)
         self.queue_manager = queue_manager
         self._drag_source_index: Optional[int] = None
+        # (track, queue index, is current) for rows not created yet, per section
+        self._up_next_pending: Iterator[Tuple[AudioTrack, int, bool]] = iter(())
+        self._just_played_pending: Iterator[Tuple[AudioTrack, int, bool]] = iter(())
+        self._up_next_rows: List[QueueTrackWidget] = []
+        # Rows are recreated on every refresh, so their thumbnails are decoded once here
+        self._thumbnails = AlbumArtThumbnails(40, crop=True, max_entries=256)
         self.setAttribute(Qt.WA_StyledBackground, True)
         self.setAcceptDrops(True)
         self._setup_ui()
@@ -357,6 +369,10 @@ class QueueWidget(QWidget):
         self.up_next_layout.addStretch()
         
         self.up_next_scroll.setWidget(self.up_next_content)
+        bar = self.up_next_scroll.verticalScrollBar()
+        bar.valueChanged.connect(self._on_up_next_scrolled)
+        # Resizes and new rows change the range without any scrolling
+        bar.rangeChanged.connect(self._on_up_next_scrolled)
         main_layout.addWidget(self.up_next_scroll, 1)
         
         # Divider
@@ -385,10 +401,13 @@ class QueueWidget(QWidget):
         self.just_played_layout.addStretch()
         
         self.just_played_scroll.setWidget(self.just_played_content)
+        bar = self.just_played_scroll.verticalScrollBar()
+        bar.valueChanged.connect(self._on_just_played_scrolled)
+        bar.rangeChanged.connect(self._on_just_played_scrolled)
         main_layout.addWidget(self.just_played_scroll, 1)
         
         # Styling
-        self.setStyleSheet("QueueWidget { background: transparent; }")
+        self.setStyleSheet("QueueWidget { background: transparent; }" + _TRACK_ROW_QSS)
         scroll_style = """
             QScrollArea {
                 background: transparent;
@@ -416,7 +435,13 @@ class QueueWidget(QWidget):
         
     def _connect_signals(self) -> None:
         """Connect queue manager signals."""
-        self.queue_manager.queue_changed.connect(self._refresh_display)
+        # Both signals often fire for one user action (e.g. adding an album to an
+        # empty queue), so the rebuild is deferred and done once per event loop pass
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._refresh_display)
+        self.queue_manager.queue_changed.connect(self._refresh_timer.start)
         self.queue_manager.current_track_changed.connect(self._on_current_track_changed)
         
     def _refresh_display(self) -> None:
@@ -431,8 +456,9 @@ class QueueWidget(QWidget):
             item = self.just_played_layout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
+        self._up_next_rows = []
         
-        queue = self.queue_manager.get_queue()
+        queue = self.queue_manager.iter_queue()
         current_index = self.queue_manager.get_current_index()
         
         # Update track count
@@ -440,28 +466,27 @@ class QueueWidget(QWidget):
         self.track_count_label.setText(f"{total_tracks} track{'s' if total_tracks != 1 else ''}")
         
         if not queue:
+            self._thumbnails.clear()
+            self._up_next_pending = iter(())
+            self._just_played_pending = iter(())
             self._show_empty_state()
             return
         
-        # Split queue into sections
-        just_played_tracks = []
-        up_next_tracks = []
-        
-        for idx, track in enumerate(queue):
-            if idx <= current_index:
-                just_played_tracks.append((track, idx))
-            else:
-                up_next_tracks.append((track, idx))
+        # Split queue into sections; rows are only created a batch at a time
+        # as each section is scrolled, so long queues rebuild quickly
+        up_next_tracks = [
+            (track, idx, False) for idx, track in enumerate(queue) if idx > current_index
+        ]
+        # Just Played is shown in reverse order - most recent first
+        just_played_tracks = [
+            (queue[idx], idx, idx == current_index) for idx in range(current_index, -1, -1)
+        ]
+        self._up_next_pending = iter(up_next_tracks)
+        self._just_played_pending = iter(just_played_tracks)
         
         # Render Up Next section (simple flat list)
         if up_next_tracks:
-            for track, idx in up_next_tracks:
-                is_current = (idx == current_index)
-                track_widget = QueueTrackWidget(track, idx, is_current, read_only=False)
-                track_widget.track_clicked.connect(self.track_double_clicked.emit)
-                track_widget.remove_requested.connect(self._on_remove_track)
-                track_widget.drag_started.connect(self._on_drag_started)
-                self.up_next_layout.insertWidget(self.up_next_layout.count() - 1, track_widget)
+            self._add_up_next_rows()
         else:
             empty_label = QLabel("No upcoming tracks")
             empty_label.setAlignment(Qt.AlignCenter)
@@ -469,20 +494,80 @@ class QueueWidget(QWidget):
             empty_label.setStyleSheet(f"color: {TEXT_MUTED}; background: transparent; padding: 40px;")
             self.up_next_layout.insertWidget(0, empty_label)
         
-        # Render Just Played section (in reverse order - most recent first)
+        # Render Just Played section
         if just_played_tracks:
-            just_played_tracks.reverse()
-            for track, idx in just_played_tracks:
-                is_current = (idx == current_index)
-                track_widget = QueueTrackWidget(track, idx, is_current, read_only=True)
-                track_widget.track_clicked.connect(self.track_double_clicked.emit)
-                self.just_played_layout.insertWidget(self.just_played_layout.count() - 1, track_widget)
+            self._add_just_played_rows()
         else:
             empty_label = QLabel("No played tracks yet")
             empty_label.setAlignment(Qt.AlignCenter)
             empty_label.setFont(FontManager.get_body_font(10))
             empty_label.setStyleSheet(f"color: {TEXT_MUTED}; background: transparent; padding: 40px;")
             self.just_played_layout.insertWidget(0, empty_label)
+            
+    def _add_up_next_rows(self) -> None:
+        """Create the next batch of Up Next rows, and more until they overflow the view."""
+        while self._add_up_next_batch() and not self._overflows(self.up_next_scroll):
+            pass
+            
+    def _add_up_next_batch(self) -> int:
+        """Create up to ROW_BATCH Up Next rows; return how many were created."""
+        added = 0
+        for track, idx, is_current in islice(self._up_next_pending, self.ROW_BATCH):
+            added += 1
+            track_widget = QueueTrackWidget(
+                track, idx, is_current, read_only=False, thumbnail=self._thumbnails.get(track)
+            )
+            track_widget.track_clicked.connect(self.track_double_clicked.emit)
+            track_widget.remove_requested.connect(self._on_remove_track)
+            track_widget.drag_started.connect(self._on_drag_started)
+            self.up_next_layout.insertWidget(self.up_next_layout.count() - 1, track_widget)
+            self._up_next_rows.append(track_widget)
+        return added
+            
+    def _add_just_played_rows(self) -> None:
+        """Create the next batch of Just Played rows, and more until they overflow the view."""
+        while self._add_just_played_batch() and not self._overflows(self.just_played_scroll):
+            pass
+            
+    def _add_just_played_batch(self) -> int:
+        """Create up to ROW_BATCH Just Played rows; return how many were created."""
+        added = 0
+        for track, idx, is_current in islice(self._just_played_pending, self.ROW_BATCH):
+            added += 1
+            track_widget = QueueTrackWidget(
+                track, idx, is_current, read_only=True, thumbnail=self._thumbnails.get(track)
+            )
+            track_widget.track_clicked.connect(self.track_double_clicked.emit)
+            self.just_played_layout.insertWidget(self.just_played_layout.count() - 1, track_widget)
+        return added
+        
+    @staticmethod
+    def _overflows(scroll: QScrollArea) -> bool:
+        """Whether a section's rows are taller than its viewport, so it can scroll.
+        
+        Rows that still fit produce no scroll or range change to load more
+        from, so batches keep being added until this holds. New rows are not
+        shown (and so not laid out) yet, so the height is estimated from the
+        first row, as every row has the same structure.
+        """
+        layout = scroll.widget().layout()
+        rows = layout.count() - 1  # Less the stretch
+        if rows <= 0:
+            return False
+        row_height = layout.itemAt(0).widget().sizeHint().height() + layout.spacing()
+        return rows * row_height > scroll.viewport().height()
+            
+    def _on_up_next_scrolled(self, *_: int) -> None:
+        """Create more Up Next rows when near the end of those created, or they don't fill the view."""
+        bar = self.up_next_scroll.verticalScrollBar()
+        if bar.value() >= bar.maximum() - bar.pageStep():
+            self._add_up_next_rows()
+            
+    def _on_just_played_scrolled(self, *_: int) -> None:
+        """Create more Just Played rows when near the end of those created, or they don't fill the view."""
+        bar = self.just_played_scroll.verticalScrollBar()
+        if bar.value() >= bar.maximum() - bar.pageStep():
+            self._add_just_played_rows()
     
     def _show_empty_state(self) -> None:
         """Show empty queue message."""
@@ -503,7 +588,7 @@ class QueueWidget(QWidget):
         
     def _on_current_track_changed(self, track: Optional[AudioTrack]) -> None:
         """Handle current track change."""
-        self._refresh_display()
+        self._refresh_timer.start()
     
     def _on_clear_queue(self) -> None:
         """Handle clear queue button click."""
@@ -516,7 +601,7 @@ class QueueWidget(QWidget):
             if image.loadFromData(QByteArray(image_data)):
                 return QPixmap.fromImage(image)
         except Exception as e:
-            print(f"Error loading album art: {e}")
+            logger.warning("Error loading album art: %s", e)
         return None
         
     def dragEnterEvent(self, event) -> None:
@@ -553,10 +638,10 @@ class QueueWidget(QWidget):
                 if self.queue_manager.size() == 1:
                     self.queue_manager.set_current_index(0)
                 event.acceptProposedAction()
-                print(f"Added track to queue: {track.title}")
+                logger.debug("Added track to queue: %s", track.title)
                 return
             except Exception as e:
-                print(f"Error adding track: {e}")
+                logger.warning("Error adding track: %s", e)
                 
         # Handle adding album/multiple tracks from library (only to Up Next)
         if mime_data.hasFormat("application/x-audiotrack-list"):
@@ -564,16 +649,13 @@ class QueueWidget(QWidget):
             try:
                 tracks_data = bytes(mime_data.data("application/x-audiotrack-list"))
                 tracks = pickle.loads(tracks_data)
-                was_empty = self.queue_manager.is_empty()
-                self.queue_manager.add_tracks(tracks)
-                # If was empty, set first track as current
-                if was_empty:
-                    self.queue_manager.set_current_index(0)
+                # If was empty, the first track becomes current
+                self.queue_manager.add_tracks(tracks, start_if_empty=True)
                 event.acceptProposedAction()
-                print(f"Added {len(tracks)} tracks to queue")
+                logger.debug("Added %d tracks to queue", len(tracks))
                 return
             except Exception as e:
-                print(f"Error adding tracks: {e}")
+                logger.warning("Error adding tracks: %s", e)
         
         # Handle reordering within queue (only in Up Next section)
         if mime_data.hasText() and self._drag_source_index is not None and in_up_next:
@@ -585,16 +667,9 @@ class QueueWidget(QWidget):
                 up_next_content_pos = self.up_next_content.mapFrom(self, drop_pos)
                 target_index = None
                 
-                for album_group in self.up_next_album_groups.values():
-                    for track_widget in album_group.track_widgets:
-                        widget_pos = track_widget.mapTo(self.up_next_content, QPoint(0, 0))
-                        widget_rect = track_widget.geometry()
-                        widget_rect.moveTo(widget_pos)
-                        
-                        if widget_rect.contains(up_next_content_pos):
-                            target_index = track_widget.index
-                            break
-                    if target_index is not None:
+                for track_widget in self._up_next_rows:
+                    if track_widget.geometry().contains(up_next_content_pos):
+                        target_index = track_widget.index
                         break
                         
                 if target_index is not None and target_index != self._drag_source_index:
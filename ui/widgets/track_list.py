@@ -2,6 +2,7 @@
 Track list widget with grouping controls
 """
 
+import logging
 from typing import List, Dict, Optional
 import re
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
@@ -13,6 +14,8 @@ from ui.themes.colors import (TEXT_PRIMARY, TEXT_SECONDARY, ACCENT_HOVER,
 from ui.themes.fonts import FontManager
 from core.audio_scanner import AudioTrack
 
+logger = logging.getLogger(__name__)
+
 
 class GroupButton(QPushButton):
     """Custom button for group selection."""
@@ -185,9 +188,10 @@ class GroupHeaderWidget(QFrame):
             art_loaded = False
             if self.tracks:
                 first_track = self.tracks[0]
-                if hasattr(first_track, 'album_art_data') and first_track.album_art_data:
+                album_art_data = first_track.get_album_art()
+                if album_art_data:
                     pixmap = QPixmap()
-                    if pixmap.loadFromData(first_track.album_art_data):
+                    if pixmap.loadFromData(album_art_data):
                         # Scale to fit while maintaining aspect ratio
                         scaled_pixmap = pixmap.scaled(
                             48, 48, 
@@ -641,4 +645,4 @@ class TrackListWidget(QWidget):
         if group_name in self.current_groups:
             tracks = self.current_groups[group_name]
             self.album_add_requested.emit(tracks)
-            print(f"Adding {len(tracks)} tracks from group: {group_name}")
+            logger.debug("Adding %d tracks from group: %s", len(tracks), group_name)
@@ -3,5 +3,6 @@ Utility functions for file I/O and helpers.
 """
 
 from utils.icon_manager import IconManager, load_icon, load_pixmap
+from utils.album_art import AlbumArtThumbnails
 
-__all__ = ["IconManager", "load_icon", "load_pixmap"]
+__all__ = ["IconManager", "load_icon", "load_pixmap", "AlbumArtThumbnails"]
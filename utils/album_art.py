@@ -0,0 +1,60 @@
+"""
+Bounded cache of scaled album art thumbnails
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, TYPE_CHECKING
+from PySide6.QtGui import QPixmap
+from PySide6.QtCore import Qt
+
+if TYPE_CHECKING:
+    from core.audio_scanner import AudioTrack
+
+
+class AlbumArtThumbnails:
+    """Least-recently-used album art thumbnails of one size, keyed by track file path.
+
+    Only the scaled pixmap is kept, not the embedded image bytes, and each
+    owner holds its own instance so the pixmaps go away with the widget.
+    """
+
+    def __init__(self, size: int, crop: bool = False, max_entries: int = 64) -> None:
+        self.size = size
+        self.crop = crop
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Path, Optional[QPixmap]]" = OrderedDict()
+
+    def get(self, track: "AudioTrack") -> Optional[QPixmap]:
+        """Get the track's art scaled to size, or None if it has none."""
+        key = track.file_path
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        album_art_data = track.get_album_art()
+        pixmap = self._scale(album_art_data) if album_art_data else None
+        self._cache[key] = pixmap
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return pixmap
+
+    def clear(self) -> None:
+        """Drop all cached thumbnails."""
+        self._cache.clear()
+
+    def _scale(self, album_art_data: bytes) -> Optional[QPixmap]:
+        """Decode image bytes and scale them to fit, or fill and crop to a square."""
+        pixmap = QPixmap()
+        if not pixmap.loadFromData(album_art_data):
+            return None
+        size = self.size
+        if not self.crop:
+            return pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+        scaled = pixmap.scaled(size, size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        if scaled.width() > size or scaled.height() > size:
+            x = (scaled.width() - size) // 2
+            y = (scaled.height() - size) // 2
+            scaled = scaled.copy(x, y, size, size)
+        return scaled
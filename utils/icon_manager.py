@@ -2,12 +2,15 @@
 Icon utility for loading and managing SVG icons
 """
 
+import logging
 from pathlib import Path
-from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtGui import QIcon, QPixmap, QPainter
 from PySide6.QtSvg import QSvgRenderer
 from PySide6.QtCore import QSize, Qt
 import os
 
+logger = logging.getLogger(__name__)
+
 # Base icon directory - use absolute path from this file
 ICON_DIR = Path(__file__).resolve().parent.parent / "assets" / "icons" / "svg"
 
@@ -16,6 +19,7 @@ class IconManager:
     """Centralized icon management for the application."""
     
     _cache = {}
+    _pixmap_cache = {}
     
     @staticmethod
     def get_icon(name: str, category: str = "") -> QIcon:
@@ -42,11 +46,12 @@ class IconManager:
         
         if icon_path.exists():
             icon = QIcon(str(icon_path))
-            IconManager._cache[cache_key] = icon
-            return icon
         else:
-            print(f"Warning: Icon not found: {icon_path}")
-            return QIcon()
+            # Cache the null icon too, so a missing file is only looked up once
+            logger.warning("Icon not found: %s", icon_path)
+            icon = QIcon()
+        IconManager._cache[cache_key] = icon
+        return icon
     
     @staticmethod
     def get_pixmap(name: str, size: int = 24, category: str = "") -> QPixmap:
@@ -61,6 +66,11 @@ class IconManager:
         Returns:
             QPixmap object
         """
+        cache_key = (category, name, size)
+        
+        if cache_key in IconManager._pixmap_cache:
+            return IconManager._pixmap_cache[cache_key]
+        
         if category:
             icon_path = ICON_DIR / category / f"{name}.svg"
         else:
@@ -70,16 +80,20 @@ class IconManager:
             renderer = QSvgRenderer(str(icon_path))
             pixmap = QPixmap(QSize(size, size))
             pixmap.fill(Qt.transparent)
-            renderer.render(pixmap)
-            return pixmap
+            painter = QPainter(pixmap)
+            renderer.render(painter)
+            painter.end()
         else:
-            print(f"Warning: Icon not found: {icon_path}")
-            return QPixmap()
+            logger.warning("Icon not found: %s", icon_path)
+            pixmap = QPixmap()
+        IconManager._pixmap_cache[cache_key] = pixmap
+        return pixmap
     
     @staticmethod
     def clear_cache() -> None:
-        """Clear the icon cache."""
+        """Clear the icon and pixmap caches."""
         IconManager._cache.clear()
+        IconManager._pixmap_cache.clear()
 
 
 # Convenience functions